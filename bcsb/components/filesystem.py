@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from ..jsonrpc import InternalError
-from ..service import Component, EndpointRegistry
+from ..service import Component, EndpointRegistry, Execution
 from ..utils import PathValidator
 
 
@@ -64,10 +64,10 @@ class Filesystem(Component):
         self._validator = validator
 
     def register(self, endpoints: EndpointRegistry) -> None:
-        endpoints.add("fs-exists", self.exists, "Inspect given path")
+        endpoints.add("fs-exists", self.exists, "Inspect given path", Execution.THREAD)
         endpoints.add("fs-get-root", self.get_root, "Base directory")
-        endpoints.add("fs-list-dir", self.list_dir, "List directory content")
-        endpoints.add("fs-upload-content", self.upload, "Upload file")
+        endpoints.add("fs-list-dir", self.list_dir, "List directory content", Execution.THREAD)
+        endpoints.add("fs-upload-content", self.upload, "Upload file", Execution.THREAD)
 
     async def exists(self, params: ExistsParams) -> ExistsResult:
         path = self._validator.validate(params.path)
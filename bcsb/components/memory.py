@@ -1,8 +1,10 @@
 from dataclasses import dataclass
+from typing import Any
 
 import psutil
 
 from ..service import Component, EndpointRegistry
+from ..utils import MemoryBudget
 
 
 @dataclass
@@ -28,13 +30,24 @@ class SwapMemory:
     sout: int
 
 
+@dataclass
+class RegistryMemory:
+    used: int
+    budget: int
+    entries: int
+
+
 @dataclass
 class MemoryInfoResult:
     virtual_memory: VirtualMemory
     swap_memory: SwapMemory
+    registry_memory: RegistryMemory
 
 
 class Memory(Component):
+    def __init__(self, budget: MemoryBudget[Any]) -> None:
+        self._budget = budget
+
     def register(self, endpoints: EndpointRegistry) -> None:
         endpoints.add("get-memory-info", self.info, "Available system memory")
 
@@ -61,4 +74,9 @@ class Memory(Component):
                 sin=swap.sin,
                 sout=swap.sout,
             ),
+            RegistryMemory(
+                used=self._budget.size,
+                budget=self._budget.max_size,
+                entries=len(self._budget),
+            ),
         )
@@ -3,8 +3,8 @@ from logging import Logger
 
 import libsonata
 
-from ..service import Component, EndpointRegistry
-from ..utils import PathValidator, parse_sonata_config
+from ..service import Component, EndpointRegistry, Execution
+from ..utils import PathValidator, SonataParser
 
 
 @dataclass
@@ -56,8 +56,9 @@ class PopulationResult:
 
 
 class SonataConfig(Component):
-    def __init__(self, validator: PathValidator, logger: Logger) -> None:
+    def __init__(self, validator: PathValidator, parser: SonataParser, logger: Logger) -> None:
         self._validator = validator
+        self._parser = parser
         self._logger = logger
 
     def register(self, endpoints: EndpointRegistry) -> None:
@@ -65,16 +66,18 @@ class SonataConfig(Component):
             "sonata-get-node-sets",
             self.get_node_sets,
             "Retreive node sets from sonata circuit",
+            Execution.THREAD,
         )
         endpoints.add(
             "sonata-list-populations",
             self.get_populations,
             "Retreive populations and reports in sonata circuit",
+            Execution.THREAD,
         )
 
     async def get_node_sets(self, params: NodeSetParams) -> NodeSetResult:
         path = self._validator.file(params.path)
-        config = parse_sonata_config(path)
+        config = self._parser.parse(path)
         try:
             nodes = libsonata.NodeSets.from_file(config.node_sets_path)
             names = sorted(nodes.names)
@@ -85,7 +88,7 @@ class SonataConfig(Component):
 
     async def get_populations(self, params: PopulationParams) -> PopulationResult:
         path = self._validator.file(params.path)
-        config = parse_sonata_config(path)
+        config = self._parser.parse(path)
         return PopulationResult(
             populations=self._get_populations(config.circuit),
             reports=self._get_reports(config.simulation) if config.simulation is not None else [],
@@ -1,19 +1,87 @@
+import hashlib
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from struct import Struct
-from typing import Any
+from enum import Enum
+from functools import partial
+from logging import Logger
+from pathlib import Path
+from typing import Any, TypeAlias
 
 import libsonata
 import numpy
 
 from bcsb.jsonrpc.exceptions import InternalError
+from bcsb.utils.file_stamp import FileStamp, get_file_stamp
 from bcsb.utils.id_generator import IdGenerator
 
-from ..jsonrpc import InvalidParams
-from ..service import Component, EndpointRegistry, Result
-from ..utils import PathValidator, parse_sonata_config, pick
+from ..jsonrpc import InvalidParams, get_session
+from ..service import Component, EndpointRegistry, Execution, Result
+from ..utils import (
+    Column,
+    ColumnCache,
+    Encoding,
+    LruCache,
+    MAX_PATTERN_PAIRS,
+    MemoryBudget,
+    NodeSetCache,
+    PackedColumn,
+    PathValidator,
+    Prefetcher,
+    Reduction,
+    ReportSummary,
+    Sampling,
+    SetOperation,
+    SharedPool,
+    SonataConfig,
+    SonataParser,
+    SpatialIndex,
+    SpikeActivity,
+    SummaryCache,
+    combine_selections,
+    count_group_pairs,
+    count_pattern_pairs,
+    encode_deltas,
+    encode_dictionary,
+    encode_values,
+    get_element_offsets,
+    get_membership_patterns,
+    is_quantized,
+    narrow_codes,
+    pack_columns,
+    pack_connectivity,
+    pick_array,
+    project_patterns,
+    reduce_elements,
+    select_column,
+    summarize_report,
+)
+from ..utils.report_summary import PERCENTILES
+from ..utils.spike_activity import MAX_INTENSITY
 
 Report = Any
-ReportPopulation = libsonata.SomaReportPopulation | libsonata.ElementReportPopulation
+ReportReader: TypeAlias = libsonata.SomaReportReader | libsonata.ElementReportReader
+ReportPopulation: TypeAlias = libsonata.SomaReportPopulation | libsonata.ElementReportPopulation
+ReportKey = tuple[str, FileStamp, str, bool]
+FramesReader = Callable[[int, int, int], numpy.ndarray]
+
+SPIKE_REPORT = ""
+SENT_FRAME = "sonata-sent-frame"
+NODES_ENTRY = "nodes"
+REPORT_ENTRY = "report"
+SESSION_OWNER = "sonata-registry-owner"
+
+MATRIX_CACHE_SIZE = 64
+EVICTED_CACHE_SIZE = 1024
+
+NODE_ITEMSIZE = 8
+FRAME_ITEMSIZE = 4
+CACHED_COLUMN_RATIO = 8
+
+BudgetKey = tuple[str, int]
+NodeGroups = tuple[int, list[numpy.ndarray]]
 
 
 @dataclass
@@ -21,13 +89,24 @@ class Nodes:
     population: libsonata.NodePopulation
     selection: libsonata.Selection
     simulation: libsonata.SimulationConfig | None
+    elements_path: str
+    index: SpatialIndex | None = None
+
+
+@dataclass
+class ReportHandle:
+    reader: ReportReader
+    population: ReportPopulation
 
 
 @dataclass
 class NodeReport:
     node_id: int
-    info: Report
-    population: ReportPopulation
+    key: ReportKey | None
+    read: FramesReader
+    frames: Prefetcher[numpy.ndarray]
+    summary: Future[ReportSummary] | None
+    cost: int
 
 
 @dataclass
@@ -36,6 +115,8 @@ class NodeParams:
     population: str
     count: int
     node_sets: list[str] = field(default_factory=list)
+    sampling: Sampling = Sampling.EVEN
+    seed: int = 0
 
 
 @dataclass
@@ -44,15 +125,119 @@ class NodeResult:
     count: int
 
 
+@dataclass
+class CombineParams:
+    ids: list[int]
+    operation: SetOperation = SetOperation.UNION
+    count: int | None = None
+    sampling: Sampling = Sampling.EVEN
+    seed: int = 0
+
+
+class QueryOutput(Enum):
+    SELECTION = "selection"
+    IDS = "ids"
+    POSITIONS = "positions"
+
+
+@dataclass
+class BoxQueryParams:
+    id: int
+    lower: list[float]
+    upper: list[float]
+    output: QueryOutput = QueryOutput.SELECTION
+
+
+@dataclass
+class SphereQueryParams:
+    id: int
+    center: list[float]
+    radius: float
+    output: QueryOutput = QueryOutput.SELECTION
+
+
+@dataclass
+class FrustumQueryParams:
+    id: int
+    planes: list[list[float]]
+    output: QueryOutput = QueryOutput.SELECTION
+
+
+@dataclass
+class QueryResult:
+    count: int
+    id: int | None = None
+
+
 @dataclass
 class NodeIdParams:
     id: int
 
 
+@dataclass
+class NodeIdsParams:
+    id: int
+    ranges: bool = False
+
+
+@dataclass
+class AttributesParams:
+    id: int
+    names: list[str]
+
+
+@dataclass
+class AttributesResult:
+    count: int
+    columns: list[PackedColumn]
+
+
+class Direction(Enum):
+    AFFERENT = "afferent"
+    EFFERENT = "efferent"
+
+
+@dataclass
+class ConnectivityParams:
+    nodes_id: int
+    path: str
+    edges: str
+    direction: Direction = Direction.AFFERENT
+    start: int = 0
+    max_edges: int = 2**20
+    counts: bool = False
+
+
+@dataclass
+class ConnectivityResult:
+    start: int
+    stop: int
+    total: int
+    edge_count: int
+    columns: list[PackedColumn]
+
+
+@dataclass
+class ConnectivityMatrixParams:
+    path: str
+    edges: str
+    sources: list[str | int]
+    targets: list[str | int]
+    max_edges: int = 2**22
+
+
+@dataclass
+class ConnectivityMatrixResult:
+    synapses: list[list[int]]
+    connections: list[list[int]]
+
+
 @dataclass
 class ReportParams:
     nodes_id: int
     name: str
+    spike_decay: float = 1.0
+    reduction: Reduction = Reduction.NONE
 
 
 @dataclass
@@ -65,27 +250,118 @@ class ReportIdParams:
     id: int
 
 
+@dataclass
+class Percentile:
+    rank: float
+    value: float
+
+
+@dataclass
+class ReportSummaryResult:
+    ready: bool
+    start: int = 0
+    frame_count: int = 0
+    min_value: float = 0.0
+    max_value: float = 0.0
+    percentiles: list[Percentile] = field(default_factory=list)
+
+
 @dataclass
 class FrameParams:
     report_id: int
     frame: int
     min_value: float
     max_value: float
+    encoding: Encoding = Encoding.UINT8
+    delta: bool = False
+
+
+@dataclass
+class FrameResult:
+    dtype: str
+    delta: bool
+
+
+@dataclass
+class FramesParams:
+    report_id: int
+    start: int
+    stop: int
+    min_value: float
+    max_value: float
+    stride: int = 1
+    encoding: Encoding = Encoding.UINT8
+    delta: bool = False
+
+
+@dataclass
+class FramesResult:
+    count: int
+    dtype: str
+    delta: bool
+
+
+@dataclass
+class SentFrame:
+    report: weakref.ref[NodeReport]
+    encoding: Encoding
+    range: tuple[float, float] | None
+    values: numpy.ndarray
 
 
 class SonataRegistry(Component):
-    def __init__(self, validator: PathValidator) -> None:
+    def __init__(
+        self,
+        validator: PathValidator,
+        parser: SonataParser,
+        node_sets: NodeSetCache,
+        prefetch_depth: int,
+        summaries: SummaryCache,
+        columns: ColumnCache,
+        budget: MemoryBudget[BudgetKey],
+        logger: Logger,
+    ) -> None:
         self._validator = validator
+        self._parser = parser
+        self._node_sets = node_sets
+        self._prefetch_depth = prefetch_depth
+        self._summaries = summaries
+        self._columns = columns
+        self._budget = budget
+        self._logger = logger
+        self._prefetch = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bcsb-prefetch")
+        self._summarize = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bcsb-summary")
+        self._attributes = ThreadPoolExecutor(thread_name_prefix="bcsb-attributes")
         self._node_ids = IdGenerator()
         self._nodes = dict[int, Nodes]()
         self._report_ids = IdGenerator()
         self._node_reports = dict[int, NodeReport]()
+        self._evicted_nodes = LruCache[int, bool](EVICTED_CACHE_SIZE)
+        self._evicted_reports = LruCache[int, bool](EVICTED_CACHE_SIZE)
+        self._owners = dict[BudgetKey, int]()
+        self._matrices = LruCache[str, ConnectivityMatrixResult](MATRIX_CACHE_SIZE)
+        self._report_readers = SharedPool[ReportKey, ReportHandle]()
+        self._closing = threading.Event()
+        self._lock = threading.RLock()
+
+    def shutdown(self) -> None:
+        self._closing.set()
+        for executor in (self._prefetch, self._summarize, self._attributes):
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def register(self, endpoints: EndpointRegistry) -> None:
         endpoints.add(
             "sonata-load-nodes",
             self.load_nodes,
             "Register a selection of nodes and return a unique ID to refer it in further requests",
+            Execution.THREAD,
+        )
+        endpoints.add(
+            "sonata-combine-nodes",
+            self.combine_nodes,
+            "Register the union, intersection or difference (first minus others) of registered node selections "
+            "of the same population, optionally sampled to count nodes, and return its unique ID",
+            Execution.THREAD,
         )
         endpoints.add(
             "sonata-unload-nodes",
@@ -95,17 +371,65 @@ class SonataRegistry(Component):
         endpoints.add(
             "sonata-get-node-ids",
             self.get_node_ids,
-            "Get IDs of nodes registered with given ID as u64 little endian binary",
+            "Get IDs of nodes registered with given ID as u64 little endian binary "
+            "(or as [start, stop) pairs if ranges is true)",
+            Execution.THREAD,
         )
         endpoints.add(
             "sonata-get-node-positions",
             self.get_node_positions,
             "Get positions of nodes registered with given ID as f32 binary (XYZXYZ...)",
+            Execution.THREAD,
+        )
+        endpoints.add(
+            "sonata-query-nodes-box",
+            self.query_nodes_box,
+            "Find registered nodes inside axis-aligned box [lower, upper] and register them as a new selection "
+            "(ID in result) or send their IDs as u64 or positions as f32 XYZ binary depending on output",
+            Execution.THREAD,
+        )
+        endpoints.add(
+            "sonata-query-nodes-sphere",
+            self.query_nodes_sphere,
+            "Find registered nodes inside sphere, output is the same as in sonata-query-nodes-box",
+            Execution.THREAD,
+        )
+        endpoints.add(
+            "sonata-query-nodes-frustum",
+            self.query_nodes_frustum,
+            "Find registered nodes inside view frustum given as planes [a, b, c, d] "
+            "with inside points verifying ax + by + cz + d >= 0, output is the same as in sonata-query-nodes-box",
+            Execution.THREAD,
+        )
+        endpoints.add(
+            "sonata-get-node-attributes",
+            self.get_node_attributes,
+            "Get attributes of nodes registered with given ID as little endian columns aligned on 8 bytes, "
+            "string attributes are sent as integer codes indexing the column dictionary",
+            Execution.THREAD,
+        )
+        endpoints.add(
+            "sonata-get-connectivity",
+            self.get_connectivity,
+            "Get afferent or efferent connectivity of registered nodes [start, stop) through given edge population "
+            "as CSR columns (offsets indexed by node rank, partner node IDs and synapse counts if counts is true), "
+            "stop is chosen to read at most max_edges edges and is the start of the next chunk until total",
+            Execution.THREAD,
+        )
+        endpoints.add(
+            "sonata-get-connectivity-matrix",
+            self.get_connectivity_matrix,
+            "Count synapses and connections (distinct node pairs) of given edge population from each source group "
+            "(node set name or registered node selection ID) to each target group as matrices (sources x targets)",
+            Execution.THREAD,
         )
         endpoints.add(
             "sonata-load-node-report",
             self.load_node_report,
-            "Load a report for given nodes and returns an ID to read frames from it",
+            "Load a report for given nodes and returns an ID to read frames from it "
+            "(empty name for spike activity decaying exponentially with spike_decay in ms), "
+            "compartments can be reduced to one value per node (mean, max, min or soma)",
+            Execution.THREAD,
         )
         endpoints.add(
             "sonata-unload-node-report",
@@ -115,100 +439,470 @@ class SonataRegistry(Component):
         endpoints.add(
             "sonata-get-report-frame",
             self.get_report_frame,
-            "Read simulation values for given eport at given frame",
+            "Read simulation values for given report at given frame encoded as dtype "
+            "(integers rescaled from [min_value, max_value]), delta is true if values were "
+            "subtracted from the previous frame sent for this report on this connection",
+            Execution.THREAD,
+        )
+        endpoints.add(
+            "sonata-get-report-frames",
+            self.get_report_frames,
+            "Read simulation values for given report in frame range [start, stop) as binary (frames x values) "
+            "encoded and delta chained as in sonata-get-report-frame",
+            Execution.THREAD,
+        )
+        endpoints.add(
+            "sonata-get-report-summary",
+            self.get_report_summary,
+            "Get value range and percentiles of given report with per-frame min, max and mean "
+            "as f32 binary (frames x 3), ready is false while it is being computed, "
+            "spike activity has a fixed range [0, 255] without percentiles nor per-frame values",
+            Execution.THREAD,
         )
 
     async def load_nodes(self, params: NodeParams) -> NodeResult:
         path = self._validator.file(params.path)
-        config = parse_sonata_config(path)
+        config = self._parser.parse(path)
         population = config.circuit.node_population(params.population)
-        selection = _select_node_sets(population, config.node_sets_path, params.node_sets)
-        selection = _filter_selection(selection, params.count)
-        nodes_id = self._node_ids.next()
-        self._nodes[nodes_id] = Nodes(population, selection, config.simulation)
+        properties = config.circuit.node_population_properties(population.name)
+        elements_path = str(Path(properties.elements_path).resolve())
+        selection = self._select_node_sets(config, population, params.node_sets)
+        read_positions = partial(self._read_positions, population, elements_path)
+        selection = _filter_selection(selection, params.count, params.sampling, params.seed, read_positions)
+        nodes_id = self._add_nodes(Nodes(population, selection, config.simulation, elements_path))
+        return NodeResult(nodes_id, selection.flat_size)
+
+    async def combine_nodes(self, params: CombineParams) -> NodeResult:
+        if not params.ids:
+            raise InvalidParams("No node selections to combine")
+        nodes = [self._get_nodes(nodes_id) for nodes_id in params.ids]
+        first = nodes[0]
+        _check_same_population(first, nodes)
+        selection = combine_selections(params.operation, [item.selection for item in nodes])
+        if params.count is not None:
+            read_positions = partial(self._read_positions, first.population, first.elements_path)
+            selection = _filter_selection(selection, params.count, params.sampling, params.seed, read_positions)
+        nodes_id = self._add_nodes(Nodes(first.population, selection, first.simulation, first.elements_path))
         return NodeResult(nodes_id, selection.flat_size)
 
     async def unload_nodes(self, params: NodeIdParams) -> None:
-        self._get_nodes(params.id)
-        for report_id, report in self._node_reports.items():
-            if report.node_id == params.id:
+        with self._lock:
+            self._get_nodes(params.id)
+            for report_id in self._get_report_ids(params.id):
                 self._remove_node_report(report_id)
-        self._remove_nodes(params.id)
+            self._remove_nodes(params.id)
 
-    async def get_node_ids(self, params: NodeIdParams) -> Result[None]:
+    async def get_node_ids(self, params: NodeIdsParams) -> Result[None]:
         nodes = self._get_nodes(params.id)
+        if params.ranges:
+            data = _pack_ranges(nodes.selection)
+            return Result(None, data)
         ids: numpy.ndarray = nodes.selection.flatten()
-        layout = Struct(f"<{len(ids)}Q")
-        data = layout.pack(*ids)
+        data = ids.astype("<u8", copy=False).data
         return Result(None, data)
 
     async def get_node_positions(self, params: NodeIdParams) -> Result[None]:
         nodes = self._get_nodes(params.id)
-        population = nodes.population
-        selection = nodes.selection
-        xs = population.get_attribute("x", selection).astype(numpy.float32)
-        ys = population.get_attribute("y", selection).astype(numpy.float32)
-        zs = population.get_attribute("z", selection).astype(numpy.float32)
-        data = _pack_positions(xs, ys, zs)
-        return Result(None, data)
+        positions = self._read_positions(nodes.population, nodes.elements_path, nodes.selection)
+        return Result(None, positions.reshape(-1).data)
+
+    async def query_nodes_box(self, params: BoxQueryParams) -> Result[QueryResult]:
+        lower = _get_vector(params.lower, "lower")
+        upper = _get_vector(params.upper, "upper")
+        index = self._get_spatial_index(params.id)
+        return self._send_query(params.id, index, index.query_box(lower, upper), params.output)
+
+    async def query_nodes_sphere(self, params: SphereQueryParams) -> Result[QueryResult]:
+        center = _get_vector(params.center, "center")
+        if params.radius < 0:
+            raise InvalidParams("Sphere radius must be positive")
+        index = self._get_spatial_index(params.id)
+        return self._send_query(params.id, index, index.query_sphere(center, params.radius), params.output)
+
+    async def query_nodes_frustum(self, params: FrustumQueryParams) -> Result[QueryResult]:
+        planes = numpy.array(params.planes, dtype=numpy.float64)
+        if planes.ndim != 2 or planes.shape[1] != 4:
+            raise InvalidParams("Frustum planes must be lists of 4 coefficients [a, b, c, d]")
+        index = self._get_spatial_index(params.id)
+        return self._send_query(params.id, index, index.query_planes(planes), params.output)
+
+    async def get_node_attributes(self, params: AttributesParams) -> Result[AttributesResult]:
+        nodes = self._get_nodes(params.id)
+        _check_attribute_names(params.names, nodes.population.attribute_names)
+        read = partial(self._read_column, nodes.population, nodes.elements_path, nodes.selection)
+        columns = list(self._attributes.map(read, params.names))
+        packed, binary = pack_columns(columns)
+        return Result(AttributesResult(nodes.selection.flat_size, packed), binary)
+
+    async def get_connectivity(self, params: ConnectivityParams) -> Result[ConnectivityResult]:
+        nodes = self._get_nodes(params.nodes_id)
+        path = self._validator.file(params.path)
+        config = self._parser.parse(path)
+        edges, partners = _get_edge_population(config.circuit, params.edges, nodes.population.name, params.direction)
+        ids: numpy.ndarray = nodes.selection.flatten()
+        if not 0 <= params.start <= len(ids):
+            raise InvalidParams(f"Invalid start {params.start} for {len(ids)} nodes")
+        if params.max_edges <= 0:
+            raise InvalidParams("Max edges must be strictly positive")
+        degree = max(edges.size / max(nodes.population.size, 1), 1.0)
+        window, selection = _select_edges(edges, ids, params.start, params.max_edges, degree, params.direction)
+        if params.direction is Direction.AFFERENT:
+            edge_nodes, edge_partners = edges.target_nodes(selection), edges.source_nodes(selection)
+        else:
+            edge_nodes, edge_partners = edges.source_nodes(selection), edges.target_nodes(selection)
+        columns = pack_connectivity(window, edge_nodes, edge_partners, partners, params.counts)
+        packed, binary = pack_columns(columns)
+        stop = params.start + len(window)
+        result = ConnectivityResult(params.start, stop, len(ids), selection.flat_size, packed)
+        return Result(result, binary)
+
+    async def get_connectivity_matrix(self, params: ConnectivityMatrixParams) -> ConnectivityMatrixResult:
+        path = self._validator.file(params.path)
+        config = self._parser.parse(path)
+        if params.edges not in config.circuit.edge_populations:
+            raise InvalidParams(f"No edge population named '{params.edges}'")
+        if params.max_edges <= 0:
+            raise InvalidParams("Max edges must be strictly positive")
+        edges = config.circuit.edge_population(params.edges)
+        key = self._get_matrix_key(config, edges, params)
+        result = self._matrices.get(key)
+        if result is not None:
+            return result
+        sources = self._get_node_groups(config, edges.source, params.sources)
+        targets = self._get_node_groups(config, edges.target, params.targets)
+        result = _count_connectivity(edges, sources, targets, params.max_edges)
+        self._matrices.put(key, result)
+        return result
 
     async def load_node_report(self, params: ReportParams) -> ReportResult:
         nodes = self._get_nodes(params.nodes_id)
-        report = _select_report(nodes.simulation, params.name)
-        population = _open_node_population_report(report, nodes.population.name)
-        report_id = self._report_ids.next()
-        self._node_reports[report_id] = NodeReport(params.nodes_id, report, population)
-        return ReportResult(report_id)
+        if params.name == SPIKE_REPORT:
+            report = self._load_spike_report(params.nodes_id, nodes, params.spike_decay)
+        else:
+            report = self._load_element_report(params.nodes_id, nodes, params.name, params.reduction)
+        return ReportResult(self._add_node_report(report))
 
     async def unload_node_report(self, params: ReportIdParams) -> None:
-        self._remove_node_report(params.id)
+        with self._lock:
+            self._remove_node_report(params.id)
+
+    async def get_report_frame(self, params: FrameParams) -> Result[FrameResult]:
+        report = self._get_node_report(params.report_id)
+        frame = report.frames.get(params.frame)
+        value_range = (params.min_value, params.max_value)
+        data = _encode(frame[numpy.newaxis], params.encoding, *value_range)
+        data, delta = _encode_deltas(params.report_id, report, data, params.encoding, value_range, params.delta)
+        result = FrameResult(params.encoding.value, delta)
+        return Result(result, data.reshape(-1).data)
 
-    async def get_report_frame(self, params: FrameParams) -> Result[None]:
+    async def get_report_frames(self, params: FramesParams) -> Result[FramesResult]:
         report = self._get_node_report(params.report_id)
-        time = params.frame * report.info.dt
-        nodes = self._nodes[report.node_id]
-        selection = nodes.selection
-        frame = report.population.get(node_ids=selection, tstart=time, tstop=time)
-        data = _rescale(frame.data, params.min_value, params.max_value)
-        binary = data.tobytes()
-        return Result(None, binary)
+        _check_frame_range(params.start, params.stop, params.stride)
+        frames = report.read(params.start, params.stop, params.stride)
+        value_range = (params.min_value, params.max_value)
+        data = _encode(frames, params.encoding, *value_range)
+        data, delta = _encode_deltas(params.report_id, report, data, params.encoding, value_range, params.delta)
+        result = FramesResult(len(data), params.encoding.value, delta)
+        return Result(result, data.reshape(-1).data)
+
+    async def get_report_summary(self, params: ReportIdParams) -> Result[ReportSummaryResult]:
+        report = self._get_node_report(params.id)
+        if report.summary is None:
+            return Result(ReportSummaryResult(ready=True, max_value=MAX_INTENSITY), b"")
+        if not report.summary.done():
+            return Result(ReportSummaryResult(ready=False), b"")
+        try:
+            summary = report.summary.result()
+        except Exception as e:
+            raise InternalError(f"Failed to summarize report: {e}")
+        result = ReportSummaryResult(
+            ready=True,
+            start=summary.start,
+            frame_count=summary.frame_count,
+            min_value=summary.min_value,
+            max_value=summary.max_value,
+            percentiles=[Percentile(rank, float(value)) for rank, value in zip(PERCENTILES, summary.percentiles)],
+        )
+        return Result(result, summary.pack().reshape(-1).data)
+
+    def _get_spatial_index(self, nodes_id: int) -> SpatialIndex:
+        nodes = self._get_nodes(nodes_id)
+        if nodes.index is not None:
+            return nodes.index
+        positions = self._read_positions(nodes.population, nodes.elements_path, nodes.selection)
+        nodes.index = SpatialIndex(positions)
+        cost = _get_nodes_cost(nodes.population, nodes.selection) + positions.nbytes + nodes.index.nbytes
+        with self._lock:
+            if nodes_id in self._nodes:
+                self._charge((NODES_ENTRY, nodes_id), cost)
+        return nodes.index
+
+    def _send_query(
+        self, nodes_id: int, index: SpatialIndex, indices: numpy.ndarray, output: QueryOutput
+    ) -> Result[QueryResult]:
+        if output is QueryOutput.POSITIONS:
+            return Result(QueryResult(len(indices)), index.positions[indices].reshape(-1).data)
+        nodes = self._get_nodes(nodes_id)
+        ids: numpy.ndarray = nodes.selection.flatten()[indices]
+        if output is QueryOutput.IDS:
+            return Result(QueryResult(len(indices)), ids.astype("<u8", copy=False).data)
+        selection = libsonata.Selection(ids)
+        query_id = self._add_nodes(Nodes(nodes.population, selection, nodes.simulation, nodes.elements_path))
+        return Result(QueryResult(len(indices), query_id), b"")
+
+    def _get_matrix_key(
+        self, config: SonataConfig, edges: libsonata.EdgePopulation, params: ConnectivityMatrixParams
+    ) -> str:
+        elements_path = config.circuit.edge_population_properties(params.edges).elements_path
+        mtime, size = get_file_stamp(elements_path)
+        node_sets_stamp = get_file_stamp(config.node_sets_path) if config.node_sets_path else None
+        node_stamps = [
+            get_file_stamp(config.circuit.node_population_properties(name).elements_path)
+            for name in (edges.source, edges.target)
+        ]
+        groups = [self._get_node_group_key(group) for group in params.sources + [None] + params.targets]
+        stamps = f"{node_sets_stamp}:{node_stamps}"
+        return f"{elements_path}:{mtime}:{size}:{params.edges}:{stamps}:{':'.join(groups)}"
+
+    def _get_node_group_key(self, group: str | int | None) -> str:
+        if group is None:
+            return "->"
+        if isinstance(group, str):
+            return f"set={group}"
+        ranges = numpy.array(self._get_nodes(group).selection.ranges, dtype="<u8")
+        return f"ids={hashlib.sha1(ranges.tobytes()).hexdigest()}"
+
+    def _get_node_groups(self, config: SonataConfig, name: str, groups: list[str | int]) -> NodeGroups:
+        population = config.circuit.node_population(name)
+        properties = config.circuit.node_population_properties(name)
+        elements_path = str(Path(properties.elements_path).resolve())
+        ids = list[numpy.ndarray]()
+        for group in groups:
+            if isinstance(group, str):
+                selection = self._select_node_sets(config, population, [group])
+            else:
+                nodes = self._get_nodes(group)
+                if nodes.population.name != name or nodes.elements_path != elements_path:
+                    raise InvalidParams(f"Node selection registered with ID {group} is not in population '{name}'")
+                selection = nodes.selection
+            ids.append(selection.flatten())
+        return population.size, ids
+
+    def _read_positions(
+        self, population: libsonata.NodePopulation, elements_path: str, selection: libsonata.Selection
+    ) -> numpy.ndarray:
+        xs, ys, zs = (self._read_column(population, elements_path, selection, name).values for name in "xyz")
+        return _pack_positions(xs, ys, zs)
+
+    def _read_column(
+        self, population: libsonata.NodePopulation, elements_path: str, selection: libsonata.Selection, name: str
+    ) -> Column:
+        column = self._get_column(population, elements_path, selection, name)
+        if column is None:
+            return _read_column(population, selection, name)
+        if selection.flat_size == population.size:
+            return column
+        return select_column(column, selection.flatten())
+
+    def _get_column(
+        self, population: libsonata.NodePopulation, elements_path: str, selection: libsonata.Selection, name: str
+    ) -> Column | None:
+        mtime, size = get_file_stamp(elements_path)
+        key = f"{elements_path}:{mtime}:{size}:{population.name}:{name}"
+        column = self._columns.load(key, name)
+        if column is not None and len(column.values) == population.size:
+            return column
+        if selection.flat_size * CACHED_COLUMN_RATIO < population.size:
+            return None
+        column = _read_column(population, population.select_all(), name)
+        try:
+            self._columns.save(key, column)
+        except OSError as e:
+            self._logger.warning("Cannot cache node attribute: %s.", e)
+        return column
+
+    def _load_element_report(self, nodes_id: int, nodes: Nodes, name: str, reduction: Reduction) -> NodeReport:
+        report = _select_report(nodes.simulation, name)
+        key = _get_report_key(report, nodes.population.name)
+        handle = self._report_readers.acquire(key, partial(_open_node_population_report, key))
+        population = handle.population
+        filename, _, _, soma = key
+        read: FramesReader = partial(_read_frames, population, nodes.selection, report.dt)
+        start, stop = _get_frame_range(population, report.dt)
+        if soma:
+            reduction = Reduction.NONE
+        if reduction is not Reduction.NONE:
+            offsets = _get_element_offsets(population, nodes.selection)
+            read = partial(_reduce_frames, read, offsets, reduction)
+            value_count = len(offsets)
+            cost = offsets.nbytes
+        elif soma:
+            value_count = nodes.selection.flat_size
+            cost = 0
+        else:
+            value_count = len(_read_frame(read, start)) if stop > start else 0
+            cost = 0
+        cost += value_count * FRAME_ITEMSIZE * (self._prefetch_depth + 1)
+        frames = Prefetcher(partial(_read_frame, read), self._prefetch_depth, self._prefetch, stop)
+        parameters = (soma, report.dt, start, stop, reduction.value)
+        cache_key = _get_summary_key(filename, nodes.population.name, nodes.selection, parameters)
+        summary = self._summarize.submit(self._summarize_report, cache_key, read, start, stop, value_count)
+        return NodeReport(nodes_id, key, read, frames, summary, cost)
+
+    def _load_spike_report(self, nodes_id: int, nodes: Nodes, decay: float) -> NodeReport:
+        simulation = _get_simulation(nodes.simulation)
+        dt = simulation.run.dt
+        frame_count = round(simulation.run.tstop / dt)
+        filename = _get_spikes_path(simulation)
+        activity = _read_spike_activity(filename, nodes.population.name, nodes.selection, dt, decay)
+        read = partial(_read_spike_frames, activity, frame_count)
+        frames = Prefetcher(partial(_read_frame, read), self._prefetch_depth, self._prefetch, frame_count)
+        cost = activity.nbytes + activity.node_count * (self._prefetch_depth + 1)
+        return NodeReport(nodes_id, None, read, frames, None, cost)
+
+    def _summarize_report(
+        self, cache_key: str, read: FramesReader, start: int, stop: int, value_count: int
+    ) -> ReportSummary:
+        summary = self._summaries.load(cache_key)
+        if summary is not None:
+            return summary
+        summary = summarize_report(partial(self._read_summary_frames, read), start, stop, value_count)
+        try:
+            self._summaries.save(cache_key, summary)
+        except OSError as e:
+            self._logger.warning("Cannot cache report summary: %s.", e)
+        return summary
+
+    def _read_summary_frames(self, read: FramesReader, start: int, stop: int) -> numpy.ndarray:
+        if self._closing.is_set():
+            raise InternalError("Report summary interrupted by shutdown")
+        return read(start, stop, 1)
+
+    def _select_node_sets(
+        self, config: SonataConfig, population: libsonata.NodePopulation, names: list[str]
+    ) -> libsonata.Selection:
+        if not names:
+            return population.select_all()
+        node_sets_path = config.node_sets_path
+        if not node_sets_path:
+            raise InvalidParams("No node sets in circuit")
+        _check_invalid_names(names, self._node_sets.names(node_sets_path))
+        properties = config.circuit.node_population_properties(population.name)
+        return self._node_sets.materialize(node_sets_path, population, properties.elements_path, names)
+
+    def _add_nodes(self, nodes: Nodes) -> int:
+        with self._lock:
+            nodes_id = self._node_ids.next()
+            self._nodes[nodes_id] = nodes
+            self._register((NODES_ENTRY, nodes_id), _get_nodes_cost(nodes.population, nodes.selection))
+        return nodes_id
+
+    def _add_node_report(self, report: NodeReport) -> int:
+        with self._lock:
+            try:
+                self._get_nodes(report.node_id)
+            except InvalidParams:
+                self._close_node_report(report)
+                raise
+            report_id = self._report_ids.next()
+            self._node_reports[report_id] = report
+            self._register((REPORT_ENTRY, report_id), report.cost)
+        return report_id
+
+    def _register(self, key: BudgetKey, cost: int) -> None:
+        self._owners[key] = self._get_owner()
+        self._charge(key, cost)
+
+    def _charge(self, key: BudgetKey, cost: int) -> None:
+        for kind, id in self._budget.add(key, cost):
+            if kind == NODES_ENTRY:
+                self._evict_nodes(id)
+            else:
+                self._evict_node_report(id)
+
+    def _get_owner(self) -> int:
+        session = get_session()
+        if SESSION_OWNER not in session.values:
+            session.values[SESSION_OWNER] = True
+            session.add_cleanup(partial(self._release_session, session.id))
+        return session.id
+
+    def _release_session(self, session_id: int) -> None:
+        with self._lock:
+            owned = [key for key, owner in self._owners.items() if owner == session_id]
+            for kind, id in owned:
+                if kind == NODES_ENTRY and id in self._nodes:
+                    self._remove_nodes(id)
+                elif kind == REPORT_ENTRY and id in self._node_reports:
+                    self._remove_node_report(id)
+                self._owners.pop((kind, id), None)
+        self._logger.info("Released %d SONATA registry entries of session %d.", len(owned), session_id)
 
     def _get_nodes(self, nodes_id: int) -> Nodes:
         nodes = self._nodes.get(nodes_id)
+        if nodes is None and nodes_id in self._evicted_nodes:
+            raise InvalidParams(
+                f"Node selection registered with ID {nodes_id} was evicted to respect memory budget, reload it"
+            )
         if nodes is None:
             raise InvalidParams(f"Cannot find node selection registered with ID {nodes_id}")
+        self._budget.touch((NODES_ENTRY, nodes_id))
         return nodes
 
     def _remove_nodes(self, nodes_id: int) -> None:
         self._get_nodes(nodes_id)
         del self._nodes[nodes_id]
+        self._budget.remove((NODES_ENTRY, nodes_id))
+        self._owners.pop((NODES_ENTRY, nodes_id), None)
         self._node_ids.recycle(nodes_id)
 
+    def _evict_nodes(self, nodes_id: int) -> None:
+        self._owners.pop((NODES_ENTRY, nodes_id), None)
+        if self._nodes.pop(nodes_id, None) is None:
+            return
+        for forgotten_id, _ in self._evicted_nodes.put(nodes_id, True):
+            self._node_ids.recycle(forgotten_id)
+        for report_id in self._get_report_ids(nodes_id):
+            self._budget.remove((REPORT_ENTRY, report_id))
+            self._evict_node_report(report_id)
+
+    def _get_report_ids(self, nodes_id: int) -> list[int]:
+        return [report_id for report_id, report in self._node_reports.items() if report.node_id == nodes_id]
+
     def _get_node_report(self, report_id: int) -> NodeReport:
         node_report = self._node_reports.get(report_id)
+        if node_report is None and report_id in self._evicted_reports:
+            raise InvalidParams(
+                f"Report registered with ID {report_id} was evicted to respect memory budget, reload it"
+            )
         if node_report is None:
             raise InvalidParams(f"Cannot find report registered with ID {report_id}")
+        self._budget.touch((REPORT_ENTRY, report_id))
         return node_report
 
     def _remove_node_report(self, report_id: int) -> None:
-        self._get_node_report(report_id)
+        report = self._get_node_report(report_id)
         del self._node_reports[report_id]
+        self._budget.remove((REPORT_ENTRY, report_id))
+        self._owners.pop((REPORT_ENTRY, report_id), None)
+        self._close_node_report(report)
         self._report_ids.recycle(report_id)
 
+    def _evict_node_report(self, report_id: int) -> None:
+        self._owners.pop((REPORT_ENTRY, report_id), None)
+        report = self._node_reports.pop(report_id, None)
+        if report is None:
+            return
+        for forgotten_id, _ in self._evicted_reports.put(report_id, True):
+            self._report_ids.recycle(forgotten_id)
+        self._close_node_report(report)
 
-def _select_node_sets(
-    population: libsonata.NodePopulation, node_sets_path: str, names: list[str]
-) -> libsonata.Selection:
-    if not node_sets_path or not names:
-        return population.select_all()
-    if names and not node_sets_path:
-        raise InvalidParams("No node sets in circuit")
-    node_sets = libsonata.NodeSets.from_file(node_sets_path)
-    _check_invalid_names(names, node_sets.names)
-    selection = libsonata.Selection([])
-    for name in names:
-        selection |= node_sets.materialize(name, population)
-    return selection
+    def _close_node_report(self, report: NodeReport) -> None:
+        report.frames.clear()
+        if report.summary is not None:
+            report.summary.cancel()
+        if report.key is not None:
+            self._report_readers.release(report.key)
 
 
 def _check_invalid_names(names: list[str], ref: set[str]) -> None:
@@ -219,41 +913,284 @@ def _check_invalid_names(names: list[str], ref: set[str]) -> None:
     raise InvalidParams(f"Invalid node sets: {message}")
 
 
-def _filter_selection(selection: libsonata.Selection, count: int) -> libsonata.Selection:
-    indices = selection.flatten()
-    indices = pick(indices, count)
-    return libsonata.Selection(indices)
+def _filter_selection(
+    selection: libsonata.Selection,
+    count: int,
+    sampling: Sampling,
+    seed: int,
+    read_positions: Callable[[libsonata.Selection], numpy.ndarray],
+) -> libsonata.Selection:
+    if count >= selection.flat_size:
+        return selection
+    positions = None
+    if sampling is Sampling.SPATIAL:
+        positions = read_positions(selection)
+    ids = selection.flatten()
+    ids = pick_array(ids, count, sampling, seed, positions)
+    return libsonata.Selection(ids)
+
+
+def _check_same_population(first: Nodes, nodes: list[Nodes]) -> None:
+    for item in nodes:
+        if item.elements_path != first.elements_path or item.population.name != first.population.name:
+            raise InvalidParams("Cannot combine node selections from different populations")
+
+
+def _get_vector(values: list[float], name: str) -> numpy.ndarray:
+    if len(values) != 3:
+        raise InvalidParams(f"Expected 3 coordinates for {name}, got {len(values)}")
+    return numpy.array(values, dtype=numpy.float64)
+
 
+def _get_nodes_cost(population: libsonata.NodePopulation, selection: libsonata.Selection) -> int:
+    return selection.flat_size * NODE_ITEMSIZE * (1 + len(population.attribute_names))
 
-def _pack_positions(xs: numpy.ndarray, ys: numpy.ndarray, zs: numpy.ndarray) -> bytes:
+
+def _check_attribute_names(names: list[str], ref: set[str]) -> None:
+    invalid = set(names) - ref
+    if not invalid:
+        return
+    message = ", ".join(f"'{name}'" for name in sorted(invalid))
+    raise InvalidParams(f"Invalid node attributes: {message}")
+
+
+def _read_column(population: libsonata.NodePopulation, selection: libsonata.Selection, name: str) -> Column:
+    if name in population.enumeration_names:
+        dictionary = population.enumeration_values(name)
+        codes = population.get_enumeration(name, selection)
+        return Column(name, narrow_codes(codes, len(dictionary)), dictionary)
+    values = numpy.asarray(population.get_attribute(name, selection))
+    if values.dtype.kind in "OUS":
+        return encode_dictionary(name, values)
+    return Column(name, values)
+
+
+def _pack_positions(xs: numpy.ndarray, ys: numpy.ndarray, zs: numpy.ndarray) -> numpy.ndarray:
     size = len(xs)
     if len(ys) != size or len(zs) != size:
         raise InternalError("Corrupted file with different node count in x, y or z")
-    layout = Struct(f"{3 * size}f")
-    positions = (i for position in zip(xs, ys, zs) for i in position)
-    return layout.pack(*positions)
+    positions = numpy.empty((size, 3), dtype=numpy.float32)
+    numpy.stack((xs, ys, zs), axis=1, out=positions)
+    return positions
 
 
-def _select_report(simulation: libsonata.SimulationConfig | None, name: str) -> Report:
+def _pack_ranges(selection: libsonata.Selection) -> memoryview:
+    ranges = numpy.array(selection.ranges, dtype="<u8")
+    return ranges.reshape(-1).data
+
+
+def _get_edge_population(
+    circuit: libsonata.CircuitConfig, name: str, population: str, direction: Direction
+) -> tuple[libsonata.EdgePopulation, int]:
+    if name not in circuit.edge_populations:
+        raise InvalidParams(f"No edge population named '{name}'")
+    edges = circuit.edge_population(name)
+    side, other = (edges.target, edges.source) if direction is Direction.AFFERENT else (edges.source, edges.target)
+    if side != population:
+        raise InvalidParams(f"Edge population '{name}' has no {direction.value} edges for population '{population}'")
+    return edges, circuit.node_population(other).size
+
+
+def _select_edges(
+    edges: libsonata.EdgePopulation,
+    ids: numpy.ndarray,
+    start: int,
+    max_edges: int,
+    degree: float,
+    direction: Direction,
+) -> tuple[numpy.ndarray, libsonata.Selection]:
+    remaining = len(ids) - start
+    if remaining == 0:
+        return ids[:0], libsonata.Selection([])
+    select = edges.afferent_edges if direction is Direction.AFFERENT else edges.efferent_edges
+    count = min(remaining, max(int(max_edges / degree), 1))
+    while True:
+        window = ids[start : start + count]
+        selection = select(window)
+        if selection.flat_size <= max_edges or count == 1:
+            return window, selection
+        count //= 2
+
+
+def _count_connectivity(
+    edges: libsonata.EdgePopulation, sources: NodeGroups, targets: NodeGroups, max_edges: int
+) -> ConnectivityMatrixResult:
+    source_size, source_groups = sources
+    target_size, target_groups = targets
+    source_patterns, source_membership = get_membership_patterns(source_size, source_groups)
+    target_patterns, target_membership = get_membership_patterns(target_size, target_groups)
+    shape = (len(source_membership), len(target_membership))
+    by_pattern = shape[0] * shape[1] <= MAX_PATTERN_PAIRS
+    if not by_pattern:
+        shape = (len(source_groups), len(target_groups))
+    count = partial(_count_pairs, source_membership, target_membership, by_pattern)
+    synapses = numpy.zeros(shape, dtype=numpy.int64)
+    connections = numpy.zeros(shape, dtype=numpy.int64)
+    active = target_membership.any(axis=1)
+    ids = numpy.flatnonzero(active[target_patterns]).astype(numpy.uint64)
+    degree = max(edges.size / max(target_size, 1), 1.0)
+    start = 0
+    while start < len(ids):
+        window, selection = _select_edges(edges, ids, start, max_edges, degree, Direction.AFFERENT)
+        start += len(window)
+        source_ids = edges.source_nodes(selection).astype(numpy.int64)
+        target_ids = edges.target_nodes(selection).astype(numpy.int64)
+        synapses += count(source_patterns[source_ids], target_patterns[target_ids])
+        pairs = numpy.unique(source_ids * target_size + target_ids)
+        source_ids, target_ids = numpy.divmod(pairs, target_size)
+        connections += count(source_patterns[source_ids], target_patterns[target_ids])
+    if by_pattern:
+        synapses = project_patterns(synapses, source_membership, target_membership)
+        connections = project_patterns(connections, source_membership, target_membership)
+    return ConnectivityMatrixResult(synapses=synapses.tolist(), connections=connections.tolist())
+
+
+def _count_pairs(
+    source_membership: numpy.ndarray,
+    target_membership: numpy.ndarray,
+    by_pattern: bool,
+    source_patterns: numpy.ndarray,
+    target_patterns: numpy.ndarray,
+) -> numpy.ndarray:
+    if by_pattern:
+        shape = (len(source_membership), len(target_membership))
+        return count_pattern_pairs(source_patterns, target_patterns, shape)
+    return count_group_pairs(source_membership[source_patterns], target_membership[target_patterns])
+
+
+def _get_simulation(simulation: libsonata.SimulationConfig | None) -> libsonata.SimulationConfig:
     if simulation is None:
         raise InvalidParams("Selected nodes have no simulations")
+    return simulation
+
+
+def _select_report(simulation: libsonata.SimulationConfig | None, name: str) -> Report:
+    simulation = _get_simulation(simulation)
     if name not in simulation.list_report_names:
         raise InvalidParams(f"Invalid report name: '{name}'")
     return simulation.report(name)
 
 
-def _open_node_population_report(report: Report, population: str) -> ReportPopulation:
-    filename = report.file_name
-    if report.type == report.Type.compartment and report.sections == report.Sections.soma:
+def _get_report_key(report: Report, population: str) -> ReportKey:
+    filename = str(Path(report.file_name).resolve())
+    soma = report.type == report.Type.compartment and report.sections == report.Sections.soma
+    return filename, get_file_stamp(filename), population, soma
+
+
+def _open_node_population_report(key: ReportKey) -> ReportHandle:
+    filename, _, population, soma = key
+    reader: ReportReader
+    if soma:
         reader = libsonata.SomaReportReader(filename)
-        return reader[population]
-    reader = libsonata.ElementReportReader(filename)
-    return reader[population]
+    else:
+        reader = libsonata.ElementReportReader(filename)
+    return ReportHandle(reader, reader[population])
 
 
-def _rescale(values: numpy.ndarray, min_value: float, max_value: float) -> numpy.ndarray:
-    if min_value >= max_value:
+def _get_element_offsets(population: ReportPopulation, selection: libsonata.Selection) -> numpy.ndarray:
+    mapping = numpy.asarray(population.get_node_id_element_id_mapping(selection))
+    return get_element_offsets(mapping.reshape(-1, 2)[:, 0])
+
+
+def _reduce_frames(
+    read: FramesReader, offsets: numpy.ndarray, reduction: Reduction, start: int, stop: int, stride: int
+) -> numpy.ndarray:
+    frames = read(start, stop, stride)
+    return reduce_elements(frames, offsets, reduction)
+
+
+def _read_frame(read: FramesReader, frame: int) -> numpy.ndarray:
+    return read(frame, frame + 1, 1)[0]
+
+
+def _check_frame_range(start: int, stop: int, stride: int) -> None:
+    if start < 0 or stop <= start:
+        raise InvalidParams(f"Invalid frame range [{start}, {stop})")
+    if stride < 1:
+        raise InvalidParams(f"Invalid frame stride {stride}")
+
+
+def _read_frames(
+    population: ReportPopulation,
+    selection: libsonata.Selection,
+    dt: float,
+    start: int,
+    stop: int,
+    stride: int,
+) -> numpy.ndarray:
+    last = start + (stop - 1 - start) // stride * stride
+    frames = population.get(node_ids=selection, tstart=start * dt, tstop=last * dt, tstride=stride)
+    return numpy.asarray(frames.data)
+
+
+def _get_frame_range(population: ReportPopulation, dt: float) -> tuple[int, int]:
+    tstart, tstop, _ = population.times
+    return round(tstart / dt), round(tstop / dt)
+
+
+def _get_spikes_path(simulation: libsonata.SimulationConfig) -> str:
+    output = simulation.output
+    return str((Path(output.output_dir) / output.spikes_file).resolve())
+
+
+def _read_spike_activity(
+    filename: str, population: str, selection: libsonata.Selection, dt: float, decay: float
+) -> SpikeActivity:
+    if decay <= 0:
+        raise InvalidParams(f"Invalid spike decay {decay}")
+    reader = libsonata.SpikeReader(filename)
+    if population not in reader.get_population_names():
+        raise InvalidParams(f"No spikes for population '{population}'")
+    spikes = reader[population].get_dict()
+    return SpikeActivity(selection.flatten(), spikes["node_ids"], spikes["timestamps"], dt, decay)
+
+
+def _read_spike_frames(activity: SpikeActivity, frame_count: int, start: int, stop: int, stride: int) -> numpy.ndarray:
+    if start < 0 or start >= frame_count:
+        raise InvalidParams(f"Frame {start} is outside spike report frames [0, {frame_count})")
+    return activity.read_frames(start, min(stop, frame_count), stride)
+
+
+def _get_summary_key(filename: str, population: str, selection: libsonata.Selection, parameters: tuple) -> str:
+    mtime, size = get_file_stamp(filename)
+    ranges = numpy.array(selection.ranges, dtype="<u8")
+    digest = hashlib.sha1(ranges.tobytes()).hexdigest()
+    values = ":".join(str(value) for value in parameters)
+    return f"{filename}:{mtime}:{size}:{population}:{digest}:{values}"
+
+
+def _encode(values: numpy.ndarray, encoding: Encoding, min_value: float, max_value: float) -> numpy.ndarray:
+    if is_quantized(encoding) and min_value >= max_value:
         raise InvalidParams(f"Invalid range [{min_value}, {max_value}]")
-    clamped = numpy.clip(values, min_value, max_value)
-    rescaled = (clamped - min_value) / (max_value - min_value)
-    return (255 * rescaled).astype(numpy.uint8)
+    return encode_values(values, encoding, min_value, max_value)
+
+
+def _encode_deltas(
+    report_id: int,
+    report: NodeReport,
+    frames: numpy.ndarray,
+    encoding: Encoding,
+    value_range: tuple[float, float],
+    delta: bool,
+) -> tuple[numpy.ndarray, bool]:
+    if not len(frames):
+        return frames, False
+    values = get_session().values
+    key = (SENT_FRAME, report_id)
+    previous: SentFrame | None = values.get(key)
+    sent = SentFrame(weakref.ref(report), encoding, value_range if is_quantized(encoding) else None, frames[-1])
+    if delta and previous is not None and _is_same_stream(previous, sent):
+        frames, sent.values = encode_deltas(frames, previous.values)
+    else:
+        delta = False
+    values[key] = sent
+    return frames, delta
+
+
+def _is_same_stream(previous: SentFrame, sent: SentFrame) -> bool:
+    return (
+        previous.report() is sent.report()
+        and previous.encoding is sent.encoding
+        and previous.range == sent.range
+        and previous.values.shape == sent.values.shape
+    )
@@ -1,9 +1,12 @@
 from dataclasses import dataclass
 
-from ..jsonrpc import InvalidParams
+from ..jsonrpc import InvalidParams, get_session
 from ..service import Component, EndpointRegistry
 
 
+STORAGE = "storage"
+
+
 @dataclass
 class GetParams:
     key: str
@@ -21,18 +24,19 @@ class SetParams:
 
 
 class Storage(Component):
-    def __init__(self) -> None:
-        self._values = dict[str, str]()
-
     def register(self, endpoints: EndpointRegistry) -> None:
         endpoints.add("storage-session-get", self.get, "Retreive stored value")
         endpoints.add("storage-session-set", self.set, "Store value")
 
     async def get(self, params: GetParams) -> GetResult:
-        value = self._values.get(params.key)
+        value = _get_values().get(params.key)
         if value is None:
             raise InvalidParams(f"No values for key '{params.key}'")
         return GetResult(value)
 
     async def set(self, params: SetParams) -> None:
-        self._values[params.key] = params.value
+        _get_values()[params.key] = params.value
+
+
+def _get_values() -> dict[str, str]:
+    return get_session().values.setdefault(STORAGE, {})
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from logging import Logger
 from pathlib import Path
 
-from ..service import Component, EndpointRegistry
+from ..service import Component, EndpointRegistry, Execution
 from ..utils import PathValidator
 
 HEADER_END = re.compile(r"(\n\n)|(\r\n\r\n)|(\r\r)")
@@ -69,7 +69,7 @@ class Volume(Component):
         self._logger = logger
 
     def register(self, endpoints: EndpointRegistry) -> None:
-        endpoints.add("volume-parse-header", self.parse_header, "Parse volume header")
+        endpoints.add("volume-parse-header", self.parse_header, "Parse volume header", Execution.THREAD)
 
     async def parse_header(self, params: VolumeHeaderParams) -> dict[str, str]:
         path = self._validator.validate_file(params.path)
@@ -13,9 +13,16 @@ from .components import (
     Volume,
 )
 from .jsonrpc import Endpoint, JsonRpcHandler
-from .service import EndpointRegistry, SchemaRegistry, Service, TokenAdapter
+from .service import EndpointRegistry, Executors, SchemaRegistry, Service, TokenAdapter
 from .settings import Settings
-from .utils import PathValidator
+from .utils import (
+    ColumnCache,
+    MemoryBudget,
+    NodeSetCache,
+    PathValidator,
+    SonataParser,
+    SummaryCache,
+)
 from .websocket import ServerMonitor, WebServer
 
 
@@ -51,16 +58,33 @@ def create_server(
         settings.port,
         create_ssl_context(settings),
         settings.max_frame_size,
+        settings.websocket_compression_threshold if settings.websocket_compression else None,
+        settings.ping_interval,
+        settings.ping_timeout,
     )
 
 
-def add_components(service: Service) -> None:
+def add_components(service: Service, settings: Settings) -> None:
+    parser = SonataParser(settings.max_sonata_configs)
+    node_sets = NodeSetCache(settings.node_sets_cache_size)
+    summaries = SummaryCache(settings.cache_directory, settings.cache_size)
+    columns = ColumnCache(settings.cache_directory, settings.cache_size)
+    budget = MemoryBudget[tuple[str, int]](settings.memory_budget)
     components = [
         Core(service.schemas, service.stop_token),
         Filesystem(service.path_validator),
-        Memory(),
-        SonataConfig(service.path_validator, service.logger),
-        SonataRegistry(service.path_validator),
+        Memory(budget),
+        SonataConfig(service.path_validator, parser, service.logger),
+        SonataRegistry(
+            service.path_validator,
+            parser,
+            node_sets,
+            settings.prefetch_depth,
+            summaries,
+            columns,
+            budget,
+            service.logger,
+        ),
         Storage(),
         Volume(service.path_validator, service.logger),
     ]
@@ -72,14 +96,15 @@ async def create_service(settings: Settings) -> Service:
     logger = create_logger(settings.log_level)
     logger.debug("%s.", settings)
     endpoints = dict[str, Endpoint]()
-    registry = EndpointRegistry(endpoints, logger)
+    executors = Executors(settings.thread_pool_size, settings.process_pool_size)
+    registry = EndpointRegistry(endpoints, logger, executors)
     schemas = SchemaRegistry(endpoints)
-    handler = JsonRpcHandler(endpoints, logger)
+    handler = JsonRpcHandler(endpoints, logger, settings.compression_threshold, settings.idle_timeout)
     future = asyncio.Future[None]()
     monitor = ServerMonitor(future)
     token = TokenAdapter(monitor)
     validator = PathValidator(settings.base_directory)
     server = create_server(settings, handler, logger, monitor)
     service = Service(server, token, registry, schemas, validator, logger)
-    add_components(service)
+    add_components(service, settings)
     return service
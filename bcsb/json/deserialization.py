@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from dataclasses import fields, is_dataclass
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
 from enum import Enum
 from types import UnionType
 from typing import Any, Literal, TypeVar, get_args, get_origin
@@ -8,85 +8,211 @@ from .type import JsonType, TypeDict, get_json_type
 
 T = TypeVar("T")
 
+Deserializer = Callable[[Any], Any]
+
 _CUSTOM_TYPES = TypeDict[Callable[[Any, type], Any]]()
+_DESERIALIZERS = dict[Any, Deserializer]()
 
 
 def add_deserializer(t: type[T], deserializer: Callable[[Any, type], T]) -> None:
     _CUSTOM_TYPES.add(t, deserializer)
+    _DESERIALIZERS.clear()
 
 
 def deserialize(data: Any, t: type[T]) -> T:
-    deserializer = _CUSTOM_TYPES.get(t)
-    if deserializer is not None:
-        return deserializer(data, t)
+    return _get_deserializer(t)(data)
+
+
+def _get_deserializer(t: Any) -> Deserializer:
+    deserializer = _DESERIALIZERS.get(t)
+    if deserializer is None:
+        deserializer = _compile(t)
+        _DESERIALIZERS[t] = deserializer
+    return deserializer
+
+
+def _compile(t: Any) -> Deserializer:
+    custom = _CUSTOM_TYPES.get(t)
+    if custom is not None:
+        return lambda data: custom(data, t)
     json_type = get_json_type(t)
     if json_type is None:
-        return _deserialize_advanced(data, t)
+        return _compile_advanced(t)
     if json_type is JsonType.UNDEFINED:
-        return data
+        return _deserialize_any
     if json_type is JsonType.NULL:
-        return t()
+        return _deserialize_null
     if json_type.primitive:
-        return t(data)
+        return t
     if json_type is JsonType.ARRAY:
-        return _deserialize_array(data, t)
+        return _compile_array(t)
     if json_type is JsonType.OBJECT:
-        return _deserialize_dict(data, t)
+        return _compile_dict(t)
     raise ValueError(f"Internal error in deserialize: {t}")
 
 
-def _deserialize_advanced(data: Any, t: type[T]) -> T:
+def _compile_advanced(t: Any) -> Deserializer:
     origin = get_origin(t)
     if origin is Literal:
-        return _deserialize_const(data, t)
+        return _compile_const(t)
     if origin is UnionType:
-        return _deserialize_oneof(data, t)
+        return _compile_oneof(t)
     if issubclass(t, Enum):
-        return t(data)
+        return t
     if is_dataclass(t):
-        return _deserialize_dataclass(data, t)
+        return _compile_dataclass(t)
     raise ValueError(f"Unsupported type for deserialization: {t}")
 
 
-def _deserialize_array(data: Any, t: type[T]) -> T:
+def _deserialize_any(data: Any) -> Any:
+    return data
+
+
+def _deserialize_null(_: Any) -> None:
+    return None
+
+
+def _compile_array(t: Any) -> Deserializer:
     args = get_args(t)
     if len(args) != 1:
         raise ValueError("Trying to deserialize array of unknown type")
-    return t(deserialize(item, args[0]) for item in data)
+    item = _get_deserializer(args[0])
+    origin = get_origin(t) or t
+    if origin is list:
+        return lambda data: [item(value) for value in data]
+    return lambda data: origin(item(value) for value in data)
 
 
-def _deserialize_dict(data: dict[str, Any], t: type[T]) -> T:
+def _compile_dict(t: Any) -> Deserializer:
     args = get_args(t)
     if len(args) != 2:
         raise ValueError("Trying to deserialize dict of unknown type")
-    return t((key, deserialize(item, args[1])) for key, item in data.items())
+    item = _get_deserializer(args[1])
+    origin = get_origin(t) or t
+    if origin is dict:
+        return lambda data: {key: item(value) for key, value in data.items()}
+    return lambda data: origin((key, item(value)) for key, value in data.items())
 
 
-def _deserialize_const(data: dict[str, Any], t: type) -> Any:
+def _compile_const(t: Any) -> Deserializer:
     (value,) = get_args(t)
-    if data != value:
-        raise ValueError(f"Invalid const: expected {value} got {data}")
-    return data
 
+    def deserialize_const(data: Any) -> Any:
+        if data != value:
+            raise ValueError(f"Invalid const: expected {value} got {data}")
+        return data
 
-def _deserialize_oneof(data: Any, t: type[T]) -> T:
-    args = get_args(t)
-    for arg in args:
-        if isinstance(data, arg):
-            return data
-    for arg in args:
-        try:
-            return deserialize(data, arg)
-        except Exception:
-            pass
-    raise ValueError(f"Cannot deserialize union type {t}")
-
-
-def _deserialize_dataclass(data: dict[str, Any], t: type) -> Any:
-    properties = dict[str, Any]()
-    for field in fields(t):
-        child = data.get(field.name)
-        if child is None:
+    return deserialize_const
+
+
+def _compile_dataclass(t: Any) -> Deserializer:
+    children = list[tuple[str, Deserializer]]()
+
+    def deserialize_dataclass(data: dict[str, Any]) -> Any:
+        properties = dict[str, Any]()
+        for name, deserializer in children:
+            child = data.get(name)
+            if child is None:
+                continue
+            properties[name] = deserializer(child)
+        return t(**properties)
+
+    _DESERIALIZERS[t] = deserialize_dataclass
+    try:
+        children.extend((item.name, _get_deserializer(item.type)) for item in fields(t))
+    except Exception:
+        del _DESERIALIZERS[t]
+        raise
+    return deserialize_dataclass
+
+
+@dataclass
+class _Option:
+    deserializer: Deserializer
+    consts: dict[str, Any] = field(default_factory=dict)
+    required: list[str] = field(default_factory=list)
+
+    def accepts(self, data: Any) -> bool:
+        if not isinstance(data, dict):
+            return True
+        if any(data.get(name, value) != value for name, value in self.consts.items()):
+            return False
+        return all(data.get(name) is not None for name in self.required)
+
+
+def _compile_oneof(t: Any) -> Deserializer:
+    primitive = {json_type: list[_Option]() for json_type in JsonType}
+    exact = {json_type: list[_Option]() for json_type in JsonType}
+    widened = {json_type: list[_Option]() for json_type in JsonType}
+    undefined = list[_Option]()
+    for arg in get_args(t):
+        option = _get_option(arg)
+        json_types = _get_json_types(arg)
+        if json_types is None:
+            undefined.append(option)
             continue
-        properties[field.name] = deserialize(child, field.type)
-    return t(**properties)
+        matches = primitive if _is_primitive(arg) else exact
+        for json_type in json_types:
+            matches[json_type].append(option)
+        if JsonType.NUMBER in json_types and JsonType.INTEGER not in json_types:
+            widened[JsonType.INTEGER].append(option)
+    options = {
+        json_type: primitive[json_type] + exact[json_type] + widened[json_type] + undefined for json_type in JsonType
+    }
+
+    def deserialize_oneof(data: Any) -> Any:
+        json_type = get_json_type(type(data))
+        candidates = undefined if json_type is None else options[json_type]
+        for option in candidates:
+            if not option.accepts(data):
+                continue
+            try:
+                return option.deserializer(data)
+            except Exception:
+                continue
+        raise ValueError(f"Cannot deserialize union type {t}")
+
+    return deserialize_oneof
+
+
+def _get_option(t: Any) -> _Option:
+    option = _Option(_get_deserializer(t))
+    if _CUSTOM_TYPES.get(t) is not None or not is_dataclass(t):
+        return option
+    for item in fields(t):
+        args = get_args(item.type)
+        if get_origin(item.type) is Literal and len(args) == 1:
+            option.consts[item.name] = args[0]
+        if item.default is MISSING and item.default_factory is MISSING:
+            option.required.append(item.name)
+    return option
+
+
+def _get_json_types(t: Any) -> set[JsonType] | None:
+    if _CUSTOM_TYPES.get(t) is not None:
+        return None
+    json_type = get_json_type(t)
+    if json_type is JsonType.UNDEFINED:
+        return None
+    if json_type is not None:
+        return {json_type}
+    origin = get_origin(t)
+    if origin is Literal:
+        return {_get_value_type(value) for value in get_args(t)}
+    if isinstance(t, type) and issubclass(t, Enum):
+        return {_get_value_type(item.value) for item in t}
+    if is_dataclass(t):
+        return {JsonType.OBJECT}
+    return None
+
+
+def _is_primitive(t: Any) -> bool:
+    if _CUSTOM_TYPES.get(t) is not None:
+        return False
+    json_type = get_json_type(t)
+    return json_type is not None and json_type.primitive
+
+
+def _get_value_type(value: Any) -> JsonType:
+    json_type = get_json_type(type(value))
+    return JsonType.UNDEFINED if json_type is None else json_type
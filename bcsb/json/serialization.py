@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import MISSING, Field, fields, is_dataclass
 from enum import Enum
 from typing import Any, TypeVar
@@ -7,46 +7,95 @@ from .type import JsonType, TypeDict, get_json_type
 
 T = TypeVar("T")
 
-_CUSTOM_TYPES = TypeDict[Callable[[Any], Any]]()
+Serializer = Callable[[Any], Any]
+
+_CUSTOM_TYPES = TypeDict[Serializer]()
+_SERIALIZERS = dict[type, Serializer]()
 
 
 def add_serializer(t: type[T], serializer: Callable[[T], Any]) -> None:
     _CUSTOM_TYPES.add(t, serializer)
+    _SERIALIZERS.clear()
 
 
 def serialize(value: Any) -> Any:
-    t = type(value)
+    return _get_serializer(type(value))(value)
+
+
+def _get_serializer(t: type) -> Serializer:
+    serializer = _SERIALIZERS.get(t)
+    if serializer is None:
+        serializer = _compile(t)
+        _SERIALIZERS[t] = serializer
+    return serializer
+
+
+def _compile(t: type) -> Serializer:
     serializer = _CUSTOM_TYPES.get(t)
     if serializer is not None:
-        return serializer(value)
+        return serializer
     json_type = get_json_type(t)
     if json_type is None:
-        return _serialize_advanced(value)
+        return _compile_advanced(t)
     if json_type.primitive:
-        return value
+        return _serialize_primitive
     if json_type is JsonType.ARRAY:
-        return [serialize(item) for item in value]
-    if json_type is JsonType.OBJECT and isinstance(value, dict):
-        return {key: serialize(item) for key, item in value.items()}
+        return _serialize_array
+    if json_type is JsonType.OBJECT and issubclass(t, dict):
+        return _serialize_dict
     raise ValueError(f"Internal error in serialization: {t}")
 
 
-def _serialize_advanced(value: Any) -> Any:
-    if isinstance(value, Enum):
-        return value.value
-    if is_dataclass(value):
-        return _serialize_dataclass(value)
-    raise ValueError(f"Unsupported type for serialization: {type(value)}")
+def _compile_advanced(t: type) -> Serializer:
+    if issubclass(t, Enum):
+        return _serialize_enum
+    if is_dataclass(t):
+        return _compile_dataclass(t)
+    return _serialize_unsupported
+
+
+def _compile_dataclass(t: type) -> Serializer:
+    names = [(field.name, _is_required(field)) for field in fields(t)]
+
+    def serialize_dataclass(value: Any) -> dict[str, Any]:
+        result = dict[str, Any]()
+        for name, required in names:
+            child = getattr(value, name)
+            if child is not None or required:
+                result[name] = _get_serializer(type(child))(child)
+        return result
+
+    return serialize_dataclass
 
 
-def _serialize_dataclass(value: Any) -> dict[str, Any]:
-    result = dict[str, Any]()
-    for field in fields(value):
-        child = getattr(value, field.name)
-        if child is not None or _is_required(field):
-            result[field.name] = serialize(child)
+def _serialize_primitive(value: Any) -> Any:
+    return value
+
+
+def _serialize_array(value: Iterable[Any]) -> list[Any]:
+    result = list[Any]()
+    last_type = None
+    serializer: Serializer = _serialize_primitive
+    for item in value:
+        t = type(item)
+        if t is not last_type:
+            serializer = _get_serializer(t)
+            last_type = t
+        result.append(serializer(item))
     return result
 
 
+def _serialize_dict(value: dict[Any, Any]) -> dict[Any, Any]:
+    return {key: _get_serializer(type(item))(item) for key, item in value.items()}
+
+
+def _serialize_enum(value: Enum) -> Any:
+    return value.value
+
+
+def _serialize_unsupported(value: Any) -> Any:
+    raise ValueError(f"Unsupported type for serialization: {type(value)}")
+
+
 def _is_required(field: Field) -> bool:
     return field.default is MISSING and field.default_factory is MISSING
@@ -14,13 +14,16 @@ from .exceptions import (
     ParseError,
 )
 from .handler import JsonRpcHandler
+from .session import Session, bind_session, get_session, unbind_session
 
 __all__ = [
+    "bind_session",
     "Endpoint",
     "EndpointHandler",
     "EndpointParams",
     "EndpointResult",
     "EndpointSchema",
+    "get_session",
     "InternalError",
     "InvalidParams",
     "InvalidRequest",
@@ -28,4 +31,6 @@ __all__ = [
     "JsonRpcHandler",
     "MethodNotFound",
     "ParseError",
+    "Session",
+    "unbind_session",
 ]
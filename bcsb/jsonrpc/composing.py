@@ -3,7 +3,7 @@ from typing import Any
 
 from ..json import serialize
 from .exceptions import JsonRpcException
-from .messages import JsonRpcError, JsonRpcErrorInfo, JsonRpcId, JsonRpcReply, Reply
+from .messages import Compression, JsonRpcError, JsonRpcErrorInfo, JsonRpcId, JsonRpcReply, Reply
 
 
 def compose_reply(reply: Reply) -> bytes | str:
@@ -12,8 +12,13 @@ def compose_reply(reply: Reply) -> bytes | str:
     return _compose_json(reply.message)
 
 
-def compose_result(result: Any, id: JsonRpcId = None, binary: bytes = b"") -> bytes | str:
-    return compose_reply(Reply(JsonRpcReply(result, id), binary))
+def compose_result(
+    result: Any,
+    id: JsonRpcId = None,
+    binary: bytes = b"",
+    compression: Compression | None = None,
+) -> bytes | str:
+    return compose_reply(Reply(JsonRpcReply(result, id, compression=compression), binary))
 
 
 def compose_error(error: JsonRpcError) -> str:
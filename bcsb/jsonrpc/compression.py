@@ -0,0 +1,41 @@
+import zlib
+
+from .messages import Compression
+
+COMPRESSION_METHOD = "zlib"
+COMPRESSION_LEVEL = 1
+
+
+def compress_binary(binary: bytes) -> tuple[bytes, Compression | None]:
+    view = memoryview(binary)
+    data = view.tobytes()
+    shuffle = view.itemsize
+    if shuffle > 1:
+        data = _shuffle(data, shuffle)
+    compressed = zlib.compress(data, COMPRESSION_LEVEL)
+    if len(compressed) >= len(data):
+        return binary, None
+    return compressed, Compression(COMPRESSION_METHOD, len(data), shuffle)
+
+
+def decompress_binary(binary: bytes, compression: Compression) -> bytes:
+    if compression.method != COMPRESSION_METHOD:
+        raise ValueError(f"Unsupported compression method: '{compression.method}'")
+    data = zlib.decompress(binary)
+    if len(data) != compression.size:
+        raise ValueError(f"Expected {compression.size} bytes after decompression, got {len(data)}")
+    if compression.shuffle > 1:
+        data = _unshuffle(data, compression.shuffle)
+    return data
+
+
+def _shuffle(data: bytes, itemsize: int) -> bytes:
+    return b"".join(data[i::itemsize] for i in range(itemsize))
+
+
+def _unshuffle(data: bytes, itemsize: int) -> bytes:
+    count = len(data) // itemsize
+    result = bytearray(len(data))
+    for i in range(itemsize):
+        result[i::itemsize] = data[i * count : (i + 1) * count]
+    return bytes(result)
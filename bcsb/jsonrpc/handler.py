@@ -1,20 +1,53 @@
+import asyncio
+from itertools import count
 from logging import Logger
 
 from ..json import JsonSchemaError, validate_schema
 from ..websocket import Connection, ConnectionClosed, ConnectionHandler
 from .composing import compose_exception, compose_result
+from .compression import compress_binary
 from .endpoint import Endpoint, EndpointParams, EndpointResult
 from .exceptions import InvalidParams, JsonRpcException, MethodNotFound, unexpected
-from .messages import Request
+from .messages import Compression, Request
 from .parsing import parse_request
+from .session import Session, bind_session, unbind_session
 
 
 class JsonRpcHandler(ConnectionHandler):
-    def __init__(self, endpoints: dict[str, Endpoint], logger: Logger) -> None:
+    def __init__(
+        self,
+        endpoints: dict[str, Endpoint],
+        logger: Logger,
+        compression_threshold: int | None = None,
+        idle_timeout: float | None = None,
+    ) -> None:
         self._endpoints = endpoints
         self._logger = logger
+        self._compression_threshold = compression_threshold
+        self._idle_timeout = idle_timeout
+        self._session_ids = count(1)
 
     async def handle(self, connection: Connection) -> None:
+        session = Session(next(self._session_ids), connection.url)
+        token = bind_session(session)
+        try:
+            await self._handle_session(connection)
+        finally:
+            self._close_session(session)
+            unbind_session(token)
+
+    def _close_session(self, session: Session) -> None:
+        self._logger.info("Releasing resources of session %d.", session.id)
+        for cleanup in reversed(session.cleanups):
+            try:
+                cleanup()
+            except Exception as e:
+                self._logger.error("Unexpected session cleanup error: %s.", e)
+        session.cleanups.clear()
+        session.values.clear()
+        self._logger.info("Session %d released.", session.id)
+
+    async def _handle_session(self, connection: Connection) -> None:
         self._logger.info("Handling messages from %s.", connection)
         while True:
             try:
@@ -22,6 +55,9 @@ class JsonRpcHandler(ConnectionHandler):
             except ConnectionClosed:
                 self._logger.info("Stop handling messages from %s.", connection)
                 return
+            except asyncio.TimeoutError:
+                self._logger.info("Closing idle connection from %s.", connection)
+                return
             except Exception as e:
                 self._logger.error("Unexpected handler error: %s", e)
                 self._logger.info("Forcing disconnection from %s.", connection)
@@ -29,7 +65,7 @@ class JsonRpcHandler(ConnectionHandler):
 
     async def _handle_next_request(self, connection: Connection) -> None:
         self._logger.info("Waiting for next request.")
-        data = await connection.receive()
+        data = await asyncio.wait_for(connection.receive(), self._idle_timeout)
         self._logger.info("Handling request.")
         try:
             self._logger.info("Parsing request.")
@@ -78,11 +114,21 @@ class JsonRpcHandler(ConnectionHandler):
         if request.id is None:
             self._logger.info("Skip reply message (no ID).")
             return
+        binary, compression = await self._compress(result.binary)
         self._logger.info("Sending reply message.")
-        data = compose_result(result.message, request.id, result.binary)
+        data = compose_result(result.message, request.id, binary, compression)
         await connection.send(data)
         self._logger.info("Reply message sent.")
 
+    async def _compress(self, binary: bytes) -> tuple[bytes, Compression | None]:
+        threshold = self._compression_threshold
+        if threshold is None or memoryview(binary).nbytes < threshold:
+            return binary, None
+        self._logger.info("Compressing binary reply.")
+        binary, compression = await asyncio.to_thread(compress_binary, binary)
+        self._logger.info("Binary reply compressed: %s.", compression)
+        return binary, compression
+
     async def _parsing_error(self, connection: Connection, e: JsonRpcException) -> None:
         data = compose_exception(e)
         self._logger.info("Notifying parsing error.")
@@ -14,11 +14,19 @@ class JsonRpcRequest:
     jsonrpc: str = JSON_RPC_VERSION
 
 
+@dataclass
+class Compression:
+    method: str
+    size: int
+    shuffle: int = 1
+
+
 @dataclass
 class JsonRpcReply:
     result: Any
     id: JsonRpcId = None
     jsonrpc: str = JSON_RPC_VERSION
+    compression: Compression | None = None
 
 
 @dataclass
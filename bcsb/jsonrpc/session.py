@@ -0,0 +1,35 @@
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+from .exceptions import InternalError
+
+
+@dataclass
+class Session:
+    id: int
+    url: str
+    values: dict[Any, Any] = field(default_factory=dict)
+    cleanups: list[Callable[[], None]] = field(default_factory=list)
+
+    def add_cleanup(self, cleanup: Callable[[], None]) -> None:
+        self.cleanups.append(cleanup)
+
+
+_current_session = ContextVar[Session | None]("session", default=None)
+
+
+def get_session() -> Session:
+    session = _current_session.get()
+    if session is None:
+        raise InternalError("No session bound to current request")
+    return session
+
+
+def bind_session(session: Session) -> Token[Session | None]:
+    return _current_session.set(session)
+
+
+def unbind_session(token: Token[Session | None]) -> None:
+    _current_session.reset(token)
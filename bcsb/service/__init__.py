@@ -1,4 +1,5 @@
 from .component import Component, EndpointRegistry
+from .execution import Execution, Executors
 from .introspection import Params, Result
 from .schemas import SchemaRegistry
 from .service import Service
@@ -7,6 +8,8 @@ from .token import StopToken, TokenAdapter
 __all__ = [
     "Component",
     "EndpointRegistry",
+    "Execution",
+    "Executors",
     "Params",
     "Result",
     "SchemaRegistry",
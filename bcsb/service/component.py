@@ -2,21 +2,41 @@ from logging import Logger
 from typing import Protocol
 
 from ..jsonrpc import Endpoint
+from .execution import Execution, Executors, check_execution
 from .introspection import Handler, create_endpoint
 
 
 class EndpointRegistry:
-    def __init__(self, endpoints: dict[str, Endpoint], logger: Logger) -> None:
+    def __init__(
+        self,
+        endpoints: dict[str, Endpoint],
+        logger: Logger,
+        executors: Executors | None = None,
+    ) -> None:
         self._endpoints = endpoints
         self._logger = logger
+        self._executors = executors or Executors()
 
-    def add(self, method: str, handler: Handler, description: str = "") -> None:
+    def add(
+        self,
+        method: str,
+        handler: Handler,
+        description: str = "",
+        execution: Execution = Execution.INLINE,
+    ) -> None:
         self._logger.info("Registering endpoint '%s'.", method)
         if method in self._endpoints:
             raise ValueError(f"Method '{method}' already registered")
-        endpoint = create_endpoint(method, description, handler, self._logger)
+        check_execution(execution, handler)
+        endpoint = create_endpoint(method, description, handler, self._logger, execution, self._executors)
         self._endpoints[method] = endpoint
 
+    def shutdown(self) -> None:
+        self._executors.shutdown()
+
 
 class Component(Protocol):
     def register(self, endpoints: EndpointRegistry) -> None: ...
+
+    def shutdown(self) -> None:
+        return
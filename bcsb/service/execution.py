@@ -0,0 +1,79 @@
+import asyncio
+import inspect
+import pickle
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
+from enum import Enum
+from threading import Lock, local
+from typing import Any
+
+_WORKER = local()
+
+
+class Execution(Enum):
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class Executors:
+    def __init__(self, thread_pool_size: int | None = None, process_pool_size: int | None = None) -> None:
+        self._thread_pool_size = thread_pool_size
+        self._process_pool_size = process_pool_size
+        self._lock = Lock()
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+
+    async def run(self, execution: Execution, function: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        if execution is Execution.INLINE:
+            return await function(*args)
+        loop = asyncio.get_running_loop()
+        if execution is Execution.THREAD:
+            context = copy_context()
+            threads = self._get_thread_pool()
+            return await loop.run_in_executor(threads, context.run, _run_coroutine, function, *args)
+        if execution is Execution.PROCESS:
+            processes = self._get_process_pool()
+            return await loop.run_in_executor(processes, _run_coroutine, function, *args)
+        raise ValueError(f"Unsupported execution policy: {execution}")
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._thread_pool is not None:
+                self._thread_pool.shutdown(cancel_futures=True)
+                self._thread_pool = None
+            if self._process_pool is not None:
+                self._process_pool.shutdown(cancel_futures=True)
+                self._process_pool = None
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(self._thread_pool_size, "bcsb-worker")
+            return self._thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(self._process_pool_size)
+            return self._process_pool
+
+
+def check_execution(execution: Execution, function: Callable[..., Any]) -> None:
+    if execution is not Execution.PROCESS:
+        return
+    if inspect.ismethod(function):
+        raise ValueError("Process execution requires a module-level function, not a bound method")
+    try:
+        pickle.dumps(function)
+    except Exception as e:
+        raise ValueError(f"Process execution requires a picklable module-level function: {e}")
+
+
+def _run_coroutine(function: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+    loop = getattr(_WORKER, "loop", None)
+    if loop is None:
+        loop = asyncio.new_event_loop()
+        _WORKER.loop = loop
+    return loop.run_until_complete(function(*args))
@@ -13,6 +13,7 @@ from ..jsonrpc import (
     EndpointResult,
     EndpointSchema,
 )
+from .execution import Execution, Executors
 
 T = TypeVar("T")
 
@@ -32,10 +33,19 @@ class Result(Generic[T]):
 
 
 class HandlerWrapper(EndpointHandler):
-    def __init__(self, params_type: type, handler: Callable[..., Awaitable[Any]], logger: Logger) -> None:
+    def __init__(
+        self,
+        params_type: type,
+        handler: Callable[..., Awaitable[Any]],
+        logger: Logger,
+        execution: Execution,
+        executors: Executors,
+    ) -> None:
         self._params_type = params_type
         self._handler = handler
         self._logger = logger
+        self._execution = execution
+        self._executors = executors
 
     async def handle(self, params: EndpointParams) -> EndpointResult:
         self._logger.info("Processing request from endpoint.")
@@ -51,12 +61,16 @@ class HandlerWrapper(EndpointHandler):
     async def _call_handler(self, params: EndpointParams) -> Any:
         if self._params_type is NoneType:
             self._logger.info("No request params.")
-            return await self._handler()
+            return await self._run()
         self._logger.info("Parsing request params.")
         arg = self._deserialize_params(params)
         self._logger.info("Request params parsed.")
         self._logger.debug("Parsed request params: %s.", arg)
-        return await self._handler(arg)
+        return await self._run(arg)
+
+    async def _run(self, *args: Any) -> Any:
+        self._logger.info("Running handler (%s).", self._execution.value)
+        return await self._executors.run(self._execution, self._handler, *args)
 
     def _deserialize_params(self, params: EndpointParams) -> Any:
         if get_origin(self._params_type) is not Params:
@@ -73,7 +87,14 @@ class HandlerWrapper(EndpointHandler):
         return EndpointResult(message, b"")
 
 
-def create_endpoint(method: str, description: str, handler: Handler, logger: Logger) -> Endpoint:
+def create_endpoint(
+    method: str,
+    description: str,
+    handler: Handler,
+    logger: Logger,
+    execution: Execution = Execution.INLINE,
+    executors: Executors | None = None,
+) -> Endpoint:
     params_type = _get_params_type(handler)
     result_type = _get_result_type(handler)
     return Endpoint(
@@ -83,7 +104,7 @@ def create_endpoint(method: str, description: str, handler: Handler, logger: Log
             params=_get_params_schema(params_type),
             result=_get_result_schema(result_type),
         ),
-        HandlerWrapper(params_type, handler, logger),
+        HandlerWrapper(params_type, handler, logger, execution, executors or Executors()),
     )
 
 
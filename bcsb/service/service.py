@@ -61,3 +61,12 @@ class Service:
             await self._server.run()
         except Exception as e:
             self._logger.critical("Service crashed while running: %s.", e)
+        finally:
+            self._shutdown()
+
+    def _shutdown(self) -> None:
+        self._logger.info("Shutting down service.")
+        for component in self._components:
+            component.shutdown()
+        self._endpoints.shutdown()
+        self._logger.info("Service shut down.")
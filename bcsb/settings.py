@@ -18,6 +18,20 @@ class Settings:
     max_frame_size: int = 2**31
     log_level: int | str = INFO
     base_directory: Path = Path()
+    max_sonata_configs: int = 16
+    node_sets_cache_size: int = 2**28
+    prefetch_depth: int = 8
+    thread_pool_size: int | None = None
+    process_pool_size: int | None = None
+    cache_directory: Path = Path.home() / ".cache" / "bcsb"
+    cache_size: int = 2**32
+    compression_threshold: int | None = None
+    websocket_compression: bool = True
+    websocket_compression_threshold: int = 1024
+    memory_budget: int = 2**33
+    ping_interval: float | None = 20.0
+    ping_timeout: float | None = 20.0
+    idle_timeout: float | None = None
 
 
 def boolean(value: str) -> bool:
@@ -43,6 +57,22 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument("--max_frame_size", type=int, help="Websocket max frame size")
     parser.add_argument("--log_level", help="[DEBUG, INFO, WARNING, ERROR, CRITICAL]")
     parser.add_argument("--base_directory", type=Path, help="Filesytem base directory")
+    parser.add_argument("--max_sonata_configs", type=int, help="Parsed SONATA configs kept in cache")
+    parser.add_argument("--node_sets_cache_size", type=int, help="Node sets cache size in bytes")
+    parser.add_argument("--prefetch_depth", type=int, help="Report frames read ahead during playback")
+    parser.add_argument("--thread_pool_size", type=int, help="Threads running blocking endpoints")
+    parser.add_argument("--process_pool_size", type=int, help="Processes running CPU bound endpoints")
+    parser.add_argument("--cache_directory", type=Path, help="Directory to store computed data")
+    parser.add_argument("--cache_size", type=int, help="Bytes of each kind of computed data kept on disk")
+    parser.add_argument("--compression_threshold", type=int, help="Compress binary replies above this size")
+    parser.add_argument("--websocket_compression", type=boolean, help="Enable permessage-deflate if true")
+    parser.add_argument(
+        "--websocket_compression_threshold", type=int, help="Deflate websocket messages above this size"
+    )
+    parser.add_argument("--memory_budget", type=int, help="Estimated bytes kept for registered nodes and reports")
+    parser.add_argument("--ping_interval", type=float, help="Seconds between keepalive pings")
+    parser.add_argument("--ping_timeout", type=float, help="Seconds to wait for a pong before closing")
+    parser.add_argument("--idle_timeout", type=float, help="Close connections without requests after this delay")
     return parser
 
 
@@ -1,11 +1,68 @@
+from .column_cache import ColumnCache
+from .columns import Column, PackedColumn, encode_dictionary, narrow_codes, pack_columns, select_column
+from .connectivity import (
+    MAX_PATTERN_PAIRS,
+    count_group_pairs,
+    count_pattern_pairs,
+    get_membership_patterns,
+    pack_connectivity,
+    project_patterns,
+)
+from .encoding import Encoding, encode_deltas, encode_values, is_quantized
 from .id_generator import IdGenerator
+from .lru_cache import LruCache
+from .memory_budget import MemoryBudget
+from .node_sets import NodeSetCache
 from .path_validator import PathValidator
-from .picking import pick
-from .sonata_parser import parse_sonata_config
+from .picking import Sampling, pick, pick_array
+from .prefetching import Prefetcher
+from .reduction import Reduction, get_element_offsets, reduce_elements
+from .report_summary import ReportSummary, SummaryCache, summarize_report
+from .selections import SetOperation, combine_selections
+from .shared_pool import SharedPool
+from .sonata_parser import SonataConfig, SonataParser, parse_sonata_config
+from .spatial_index import SpatialIndex
+from .spike_activity import SpikeActivity
 
 __all__ = [
+    "Column",
+    "ColumnCache",
+    "combine_selections",
+    "count_group_pairs",
+    "count_pattern_pairs",
+    "encode_deltas",
+    "encode_dictionary",
+    "encode_values",
+    "Encoding",
+    "get_element_offsets",
+    "get_membership_patterns",
     "IdGenerator",
+    "is_quantized",
+    "LruCache",
+    "MAX_PATTERN_PAIRS",
+    "MemoryBudget",
+    "narrow_codes",
+    "NodeSetCache",
+    "pack_columns",
+    "pack_connectivity",
+    "PackedColumn",
     "parse_sonata_config",
     "PathValidator",
     "pick",
+    "pick_array",
+    "Prefetcher",
+    "project_patterns",
+    "reduce_elements",
+    "Reduction",
+    "ReportSummary",
+    "Sampling",
+    "select_column",
+    "SetOperation",
+    "SharedPool",
+    "SonataConfig",
+    "SonataParser",
+    "SpatialIndex",
+    "SpikeActivity",
+    "summarize_report",
+    "SummaryCache",
 ]
@@ -0,0 +1,44 @@
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class _Entry:
+    paths: list[Path] = field(default_factory=list)
+    size: int = 0
+    last_use: float = 0.0
+
+
+def mark_used(path: Path) -> None:
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def prune_directory(directory: Path, max_size: int) -> None:
+    entries = _get_entries(directory)
+    total = sum(entry.size for entry in entries)
+    for entry in sorted(entries, key=lambda entry: entry.last_use):
+        if total <= max_size:
+            break
+        for path in entry.paths:
+            path.unlink(missing_ok=True)
+        total -= entry.size
+
+
+def _get_entries(directory: Path) -> list[_Entry]:
+    entries = dict[str, _Entry]()
+    for path in directory.iterdir():
+        if path.suffix == ".tmp":
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entry = entries.setdefault(path.name.split(".")[0], _Entry())
+        entry.paths.append(path)
+        entry.size += stat.st_size
+        entry.last_use = max(entry.last_use, stat.st_mtime)
+    return list(entries.values())
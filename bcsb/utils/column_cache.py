@@ -0,0 +1,49 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy
+
+from .cache_directory import mark_used, prune_directory
+from .columns import Column
+
+
+class ColumnCache:
+    def __init__(self, directory: Path, max_size: int) -> None:
+        self._directory = directory / "columns"
+        self._max_size = max_size
+
+    def load(self, key: str, name: str) -> Column | None:
+        path = self._get_path(key)
+        values_path = path.with_suffix(".npy")
+        try:
+            dictionary = json.loads(path.with_suffix(".json").read_text())
+            values = numpy.load(values_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        mark_used(values_path)
+        return Column(name, values, dictionary)
+
+    def save(self, key: str, column: Column) -> None:
+        path = self._get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        dictionary_path = path.with_suffix(".json")
+        temporary = _get_temporary_path(dictionary_path)
+        temporary.write_text(json.dumps(column.dictionary))
+        temporary.replace(dictionary_path)
+        values_path = path.with_suffix(".npy")
+        temporary = _get_temporary_path(values_path)
+        with temporary.open("wb") as file:
+            numpy.save(file, column.values)
+        temporary.replace(values_path)
+        prune_directory(path.parent, self._max_size)
+
+    def _get_path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return self._directory / digest
+
+
+def _get_temporary_path(path: Path) -> Path:
+    return path.with_suffix(f"{path.suffix}.{os.getpid()}.{threading.get_ident()}.tmp")
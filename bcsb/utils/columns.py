@@ -0,0 +1,57 @@
+from dataclasses import dataclass, field
+
+import numpy
+
+ALIGNMENT = 8
+
+
+@dataclass
+class Column:
+    name: str
+    values: numpy.ndarray
+    dictionary: list[str] = field(default_factory=list)
+
+
+@dataclass
+class PackedColumn:
+    name: str
+    dtype: str
+    offset: int
+    count: int
+    dictionary: list[str]
+
+
+def narrow_codes(codes: numpy.ndarray, count: int) -> numpy.ndarray:
+    for dtype in ("u1", "<u2", "<u4"):
+        if count <= numpy.iinfo(dtype).max + 1:
+            return codes.astype(dtype)
+    return codes.astype("<u8")
+
+
+def encode_dictionary(name: str, values: numpy.ndarray) -> Column:
+    dictionary, codes = numpy.unique(values.astype(str), return_inverse=True)
+    return Column(name, narrow_codes(codes, len(dictionary)), dictionary.tolist())
+
+
+def select_column(column: Column, indices: numpy.ndarray) -> Column:
+    values = column.values[indices]
+    if not column.dictionary:
+        return Column(column.name, values)
+    used, codes = numpy.unique(values, return_inverse=True)
+    dictionary = [column.dictionary[index] for index in used]
+    return Column(column.name, narrow_codes(codes, len(used)), dictionary)
+
+
+def pack_columns(columns: list[Column]) -> tuple[list[PackedColumn], bytes]:
+    packed = list[PackedColumn]()
+    chunks = list[bytes]()
+    offset = 0
+    for column in columns:
+        values = column.values.astype(column.values.dtype.newbyteorder("<"), copy=False)
+        data = values.tobytes()
+        padding = -len(data) % ALIGNMENT
+        packed.append(PackedColumn(column.name, values.dtype.name, offset, len(values), column.dictionary))
+        chunks.append(data)
+        chunks.append(bytes(padding))
+        offset += len(data) + padding
+    return packed, b"".join(chunks)
@@ -0,0 +1,74 @@
+import numpy
+
+from .columns import Column, narrow_codes
+
+MAX_PATTERN_PAIRS = 2**22
+
+
+def pack_connectivity(
+    node_ids: numpy.ndarray,
+    edge_nodes: numpy.ndarray,
+    edge_partners: numpy.ndarray,
+    partner_count: int,
+    counts: bool = False,
+) -> list[Column]:
+    order = numpy.argsort(node_ids)
+    ranks = order[numpy.searchsorted(node_ids, edge_nodes, sorter=order)]
+    order = numpy.lexsort((edge_partners, ranks))
+    ranks = ranks[order]
+    partners = edge_partners[order]
+    synapses = None
+    if counts:
+        first = numpy.ones(len(ranks), dtype=bool)
+        first[1:] = (ranks[1:] != ranks[:-1]) | (partners[1:] != partners[:-1])
+        starts = numpy.flatnonzero(first)
+        synapses = numpy.diff(numpy.append(starts, len(ranks)))
+        ranks = ranks[starts]
+        partners = partners[starts]
+    offsets = numpy.zeros(len(node_ids) + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(ranks, minlength=len(node_ids)), out=offsets[1:])
+    columns = [
+        Column("offsets", narrow_codes(offsets, int(offsets[-1]) + 1)),
+        Column("nodes", narrow_codes(partners, partner_count)),
+    ]
+    if synapses is not None:
+        count = int(synapses.max(initial=0)) + 1
+        columns.append(Column("counts", narrow_codes(synapses, count)))
+    return columns
+
+
+def get_membership_patterns(size: int, groups: list[numpy.ndarray]) -> tuple[numpy.ndarray, numpy.ndarray]:
+    width = max((len(groups) + 63) // 64, 1)
+    codes = numpy.zeros((size, width), dtype=numpy.uint64)
+    for index, ids in enumerate(groups):
+        codes[ids, index // 64] |= numpy.uint64(1 << index % 64)
+    if width == 1:
+        unique, patterns = numpy.unique(codes[:, 0], return_inverse=True)
+        unique = unique[:, numpy.newaxis]
+    else:
+        unique, patterns = numpy.unique(codes, axis=0, return_inverse=True)
+    bits = numpy.arange(len(groups))
+    membership = (unique[:, bits // 64] >> (bits % 64).astype(numpy.uint64)) & numpy.uint64(1)
+    return patterns.reshape(-1), membership.astype(numpy.uint8)
+
+
+def count_pattern_pairs(
+    source_patterns: numpy.ndarray, target_patterns: numpy.ndarray, shape: tuple[int, int]
+) -> numpy.ndarray:
+    keys = source_patterns.astype(numpy.int64) * shape[1] + target_patterns
+    counts = numpy.bincount(keys, minlength=shape[0] * shape[1])
+    return counts.reshape(shape)
+
+
+def count_group_pairs(source_membership: numpy.ndarray, target_membership: numpy.ndarray) -> numpy.ndarray:
+    sources = source_membership.astype(numpy.float64)
+    targets = target_membership.astype(numpy.float64)
+    return numpy.rint(sources.T @ targets).astype(numpy.int64)
+
+
+def project_patterns(
+    counts: numpy.ndarray, source_membership: numpy.ndarray, target_membership: numpy.ndarray
+) -> numpy.ndarray:
+    sources = source_membership.astype(numpy.int64)
+    targets = target_membership.astype(numpy.int64)
+    return sources.T @ counts @ targets
@@ -0,0 +1,41 @@
+from enum import Enum
+
+import numpy
+
+
+class Encoding(Enum):
+    UINT8 = "uint8"
+    UINT16 = "uint16"
+    FLOAT16 = "float16"
+    FLOAT32 = "float32"
+
+
+DTYPES: dict[Encoding, numpy.dtype] = {
+    Encoding.UINT8: numpy.dtype("u1"),
+    Encoding.UINT16: numpy.dtype("<u2"),
+    Encoding.FLOAT16: numpy.dtype("<f2"),
+    Encoding.FLOAT32: numpy.dtype("<f4"),
+}
+
+
+def is_quantized(encoding: Encoding) -> bool:
+    return DTYPES[encoding].kind == "u"
+
+
+def encode_values(values: numpy.ndarray, encoding: Encoding, min_value: float, max_value: float) -> numpy.ndarray:
+    dtype = DTYPES[encoding]
+    if not is_quantized(encoding):
+        return values.astype(dtype, copy=False)
+    if min_value >= max_value:
+        raise ValueError(f"Invalid range [{min_value}, {max_value}]")
+    clamped = numpy.clip(values, min_value, max_value)
+    rescaled = (clamped - min_value) / (max_value - min_value)
+    return (numpy.iinfo(dtype).max * rescaled).astype(dtype)
+
+
+def encode_deltas(frames: numpy.ndarray, previous: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+    deltas = numpy.empty_like(frames)
+    for index, frame in enumerate(frames):
+        numpy.subtract(frame, previous, out=deltas[index])
+        previous = previous + deltas[index]
+    return deltas, previous
@@ -0,0 +1,11 @@
+from pathlib import Path
+
+FileStamp = tuple[int, int]
+
+
+def get_file_stamp(path: Path | str) -> FileStamp:
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return -1, -1
+    return stat.st_mtime_ns, stat.st_size
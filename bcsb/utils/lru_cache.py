@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import RLock
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def _unit_size(_: Any) -> int:
+    return 1
+
+
+class LruCache(Generic[K, V]):
+    def __init__(self, max_size: int, size_of: Callable[[V], int] = _unit_size) -> None:
+        self._lock = RLock()
+        self._max_size = max_size
+        self._size_of = size_of
+        self._size = 0
+        self._values = OrderedDict[K, tuple[V, int]]()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._values
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            item = self._values.get(key)
+            if item is None:
+                return None
+            self._values.move_to_end(key)
+            return item[0]
+
+    def put(self, key: K, value: V) -> list[tuple[K, V]]:
+        size = self._size_of(value)
+        with self._lock:
+            self.remove(key)
+            self._values[key] = (value, size)
+            self._size += size
+            return self._evict()
+
+    def remove(self, key: K) -> V | None:
+        with self._lock:
+            item = self._values.pop(key, None)
+            if item is None:
+                return None
+            value, size = item
+            self._size -= size
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._size = 0
+
+    def _evict(self) -> list[tuple[K, V]]:
+        evicted = list[tuple[K, V]]()
+        while self._size > self._max_size and self._values:
+            key, (value, size) = self._values.popitem(last=False)
+            self._size -= size
+            evicted.append((key, value))
+        return evicted
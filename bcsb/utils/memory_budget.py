@@ -0,0 +1,57 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class MemoryBudget(Generic[K]):
+    def __init__(self, max_size: int) -> None:
+        self._lock = Lock()
+        self._max_size = max_size
+        self._size = 0
+        self._costs = OrderedDict[K, int]()
+
+    def __len__(self) -> int:
+        return len(self._costs)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._costs
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def add(self, key: K, cost: int) -> list[K]:
+        with self._lock:
+            self._remove(key)
+            self._costs[key] = cost
+            self._size += cost
+            return self._evict()
+
+    def touch(self, key: K) -> None:
+        with self._lock:
+            if key in self._costs:
+                self._costs.move_to_end(key)
+
+    def remove(self, key: K) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: K) -> None:
+        cost = self._costs.pop(key, None)
+        if cost is not None:
+            self._size -= cost
+
+    def _evict(self) -> list[K]:
+        evicted = list[K]()
+        while self._size > self._max_size and len(self._costs) > 1:
+            key, cost = self._costs.popitem(last=False)
+            self._size -= cost
+            evicted.append(key)
+        return evicted
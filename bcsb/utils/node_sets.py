@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import libsonata
+
+from .file_stamp import FileStamp, get_file_stamp
+from .lru_cache import LruCache
+from .selections import get_selection_size, union
+
+SelectionKey = tuple[Path, FileStamp, str, str, str]
+
+
+@dataclass
+class _NodeSetsFile:
+    node_sets: libsonata.NodeSets
+    stamp: FileStamp
+
+
+class NodeSetCache:
+    def __init__(self, max_size: int, max_files: int = 8) -> None:
+        self._files = LruCache[Path, _NodeSetsFile](max_files)
+        self._selections = LruCache[SelectionKey, libsonata.Selection](max_size, get_selection_size)
+
+    def names(self, path: Path | str) -> set[str]:
+        file = self._load(Path(path).resolve())
+        return file.node_sets.names
+
+    def materialize(
+        self,
+        path: Path | str,
+        population: libsonata.NodePopulation,
+        nodes_path: str,
+        names: list[str],
+    ) -> libsonata.Selection:
+        path = Path(path).resolve()
+        file = self._load(path)
+        selections = list[libsonata.Selection]()
+        for name in dict.fromkeys(names):
+            key = (path, file.stamp, nodes_path, population.name, name)
+            selection = self._selections.get(key)
+            if selection is None:
+                selection = file.node_sets.materialize(name, population)
+                self._selections.put(key, selection)
+            selections.append(selection)
+        if len(selections) == 1:
+            return selections[0]
+        return union(selections)
+
+    def _load(self, path: Path) -> _NodeSetsFile:
+        stamp = get_file_stamp(path)
+        file = self._files.get(path)
+        if file is None or file.stamp != stamp:
+            node_sets = libsonata.NodeSets.from_file(str(path))
+            file = _NodeSetsFile(node_sets, stamp)
+            self._files.put(path, file)
+        return file
@@ -1,9 +1,18 @@
 from collections.abc import Sequence
+from enum import Enum
 from typing import TypeVar
 
+import numpy
+
 T = TypeVar("T")
 
 
+class Sampling(Enum):
+    EVEN = "even"
+    RANDOM = "random"
+    SPATIAL = "spatial"
+
+
 def pick(items: Sequence[T], count: int) -> list[T]:
     total = len(items)
     if count >= total:
@@ -19,3 +28,78 @@ def pick(items: Sequence[T], count: int) -> list[T]:
             return result
         result.append(items[index])
     return result
+
+
+def get_even_indices(total: int, count: int) -> numpy.ndarray:
+    if count >= total:
+        return numpy.arange(total, dtype=numpy.int64)
+    if count <= 0:
+        return numpy.empty(0, dtype=numpy.int64)
+    gaps = count + 1
+    step, remainder = divmod(total, gaps)
+    ranks = numpy.arange(1, count + 1, dtype=numpy.int64)
+    return ranks * step + numpy.maximum(ranks - (gaps - remainder), 0)
+
+
+def get_random_indices(total: int, count: int, seed: int) -> numpy.ndarray:
+    if count >= total:
+        return numpy.arange(total, dtype=numpy.int64)
+    if count <= 0:
+        return numpy.empty(0, dtype=numpy.int64)
+    generator = numpy.random.default_rng(seed)
+    indices = generator.choice(total, count, replace=False)
+    indices.sort()
+    return indices
+
+
+def get_spatial_indices(positions: numpy.ndarray, count: int, seed: int) -> numpy.ndarray:
+    total = len(positions)
+    if count >= total:
+        return numpy.arange(total, dtype=numpy.int64)
+    if count <= 0:
+        return numpy.empty(0, dtype=numpy.int64)
+    voxels = _get_voxels(positions, count)
+    generator = numpy.random.default_rng(seed)
+    shuffle = generator.permutation(total)
+    order = shuffle[numpy.argsort(voxels[shuffle], kind="stable")]
+    voxels = voxels[order]
+    starts = numpy.flatnonzero(numpy.concatenate(([True], voxels[1:] != voxels[:-1])))
+    sizes = numpy.diff(numpy.append(starts, total))
+    ranks = numpy.arange(total) - numpy.repeat(starts, sizes)
+    keys = ranks * (voxels[-1] + 1) + voxels
+    indices = order[numpy.argpartition(keys, count - 1)[:count]]
+    indices.sort()
+    return indices
+
+
+def pick_array(
+    items: numpy.ndarray,
+    count: int,
+    sampling: Sampling = Sampling.EVEN,
+    seed: int = 0,
+    positions: numpy.ndarray | None = None,
+) -> numpy.ndarray:
+    total = len(items)
+    if count >= total:
+        return items
+    if sampling is Sampling.RANDOM:
+        return items[get_random_indices(total, count, seed)]
+    if sampling is Sampling.SPATIAL:
+        if positions is None:
+            raise ValueError("Spatial sampling requires positions")
+        return items[get_spatial_indices(positions, count, seed)]
+    return items[get_even_indices(total, count)]
+
+
+def _get_voxels(positions: numpy.ndarray, count: int) -> numpy.ndarray:
+    lower = positions.min(axis=0)
+    extent = (positions.max(axis=0) - lower).astype(numpy.float64)
+    spread = extent > 0
+    if not spread.any():
+        return numpy.zeros(len(positions), dtype=numpy.int64)
+    volume = numpy.prod(extent[spread])
+    size = (volume / count) ** (1 / numpy.count_nonzero(spread))
+    shape = numpy.maximum(numpy.ceil(extent / size), 1).astype(numpy.int64)
+    cells = numpy.floor((positions - lower) / size).astype(numpy.int64)
+    cells = numpy.minimum(cells, shape - 1)
+    return numpy.ravel_multi_index(cells.T, shape)
@@ -0,0 +1,58 @@
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from threading import Lock
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class Prefetcher(Generic[T]):
+    def __init__(self, read: Callable[[int], T], depth: int, executor: Executor, stop: int) -> None:
+        self._read = read
+        self._depth = depth
+        self._stop = stop
+        self._executor = executor
+        self._lock = Lock()
+        self._last: int | None = None
+        self._step = 0
+        self._items = dict[int, Future[T]]()
+
+    @property
+    def buffered(self) -> int:
+        return len(self._items)
+
+    def get(self, index: int) -> T:
+        with self._lock:
+            future = self._items.pop(index, None)
+            window = self._advance(index)
+            self._discard(window)
+            self._schedule(window)
+        if future is not None:
+            return future.result()
+        return self._read(index)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._discard([])
+            self._last = None
+            self._step = 0
+
+    def _advance(self, index: int) -> list[int]:
+        step = 0 if self._last is None else index - self._last
+        regular = step != 0 and step == self._step
+        self._last = index
+        self._step = step
+        if not regular:
+            return []
+        keys = (index + i * step for i in range(1, self._depth + 1))
+        return [key for key in keys if 0 <= key < self._stop]
+
+    def _discard(self, window: list[int]) -> None:
+        for key in list(self._items):
+            if key not in window:
+                self._items.pop(key).cancel()
+
+    def _schedule(self, window: list[int]) -> None:
+        for key in window:
+            if key not in self._items:
+                self._items[key] = self._executor.submit(self._read, key)
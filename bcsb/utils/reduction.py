@@ -0,0 +1,36 @@
+from enum import Enum
+
+import numpy
+
+
+class Reduction(Enum):
+    NONE = "none"
+    MEAN = "mean"
+    MAX = "max"
+    MIN = "min"
+    SOMA = "soma"
+
+
+def get_element_offsets(node_ids: numpy.ndarray) -> numpy.ndarray:
+    if len(node_ids) == 0:
+        return numpy.empty(0, dtype=numpy.int64)
+    starts = numpy.concatenate(([True], node_ids[1:] != node_ids[:-1]))
+    return numpy.flatnonzero(starts)
+
+
+def reduce_elements(values: numpy.ndarray, offsets: numpy.ndarray, reduction: Reduction) -> numpy.ndarray:
+    if reduction is Reduction.NONE:
+        return values
+    if len(offsets) == 0:
+        return values[..., :0]
+    if reduction is Reduction.SOMA:
+        return values[..., offsets]
+    if reduction is Reduction.MAX:
+        return numpy.maximum.reduceat(values, offsets, axis=-1)
+    if reduction is Reduction.MIN:
+        return numpy.minimum.reduceat(values, offsets, axis=-1)
+    if reduction is Reduction.MEAN:
+        sums = numpy.add.reduceat(values, offsets, axis=-1, dtype=numpy.float64)
+        counts = numpy.diff(numpy.append(offsets, values.shape[-1]))
+        return (sums / counts).astype(values.dtype)
+    raise ValueError(f"Unsupported reduction: {reduction}")
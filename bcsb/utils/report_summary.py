@@ -0,0 +1,108 @@
+import hashlib
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy
+
+from .cache_directory import mark_used, prune_directory
+
+PERCENTILES = (1.0, 5.0, 25.0, 50.0, 75.0, 95.0, 99.0)
+
+FrameReader = Callable[[int, int], numpy.ndarray]
+
+
+@dataclass
+class ReportSummary:
+    start: int
+    minimums: numpy.ndarray
+    maximums: numpy.ndarray
+    means: numpy.ndarray
+    percentiles: numpy.ndarray
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.means)
+
+    @property
+    def min_value(self) -> float:
+        return float(self.minimums.min()) if self.frame_count else 0.0
+
+    @property
+    def max_value(self) -> float:
+        return float(self.maximums.max()) if self.frame_count else 0.0
+
+    def pack(self) -> numpy.ndarray:
+        return numpy.stack((self.minimums, self.maximums, self.means), axis=1).astype(numpy.float32)
+
+
+def summarize_report(
+    read: FrameReader,
+    start: int,
+    stop: int,
+    value_count: int,
+    chunk_size: int = 2**24,
+    max_samples: int = 2**20,
+) -> ReportSummary:
+    frame_count = max(stop - start, 0)
+    minimums = numpy.zeros(frame_count, dtype=numpy.float32)
+    maximums = numpy.zeros(frame_count, dtype=numpy.float32)
+    means = numpy.zeros(frame_count, dtype=numpy.float32)
+    if value_count == 0 or frame_count == 0:
+        return ReportSummary(start, minimums, maximums, means, numpy.zeros(len(PERCENTILES)))
+    step = -(-frame_count * value_count // max_samples)
+    frames_per_chunk = max(chunk_size // value_count, 1)
+    samples = list[numpy.ndarray]()
+    for first in range(0, frame_count, frames_per_chunk):
+        last = min(first + frames_per_chunk, frame_count)
+        frames = read(start + first, start + last)
+        count = len(frames)
+        minimums[first : first + count] = frames.min(axis=1)
+        maximums[first : first + count] = frames.max(axis=1)
+        means[first : first + count] = frames.mean(axis=1)
+        offset = -first * value_count % step
+        samples.append(frames.reshape(-1)[offset::step])
+    percentiles = numpy.percentile(numpy.concatenate(samples), PERCENTILES)
+    return ReportSummary(start, minimums, maximums, means, percentiles)
+
+
+class SummaryCache:
+    def __init__(self, directory: Path, max_size: int) -> None:
+        self._directory = directory / "summaries"
+        self._max_size = max_size
+
+    def load(self, key: str) -> ReportSummary | None:
+        path = self._get_path(key)
+        if not path.is_file():
+            return None
+        mark_used(path)
+        with numpy.load(path) as data:
+            return ReportSummary(
+                start=int(data["start"]),
+                minimums=data["minimums"],
+                maximums=data["maximums"],
+                means=data["means"],
+                percentiles=data["percentiles"],
+            )
+
+    def save(self, key: str, summary: ReportSummary) -> None:
+        path = self._get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with temporary.open("wb") as file:
+            numpy.savez(
+                file,
+                start=summary.start,
+                minimums=summary.minimums,
+                maximums=summary.maximums,
+                means=summary.means,
+                percentiles=summary.percentiles,
+            )
+        temporary.replace(path)
+        prune_directory(path.parent, self._max_size)
+
+    def _get_path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return self._directory / f"{digest}.npz"
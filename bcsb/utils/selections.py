@@ -0,0 +1,114 @@
+import operator
+from enum import Enum
+from functools import partial, reduce
+
+import libsonata
+import numpy
+
+RANGE_SIZE = 16
+FLAT_SIZE_LIMIT = 2**24
+
+
+class SetOperation(Enum):
+    UNION = "union"
+    INTERSECTION = "intersection"
+    DIFFERENCE = "difference"
+
+
+def get_ranges(selection: libsonata.Selection) -> numpy.ndarray:
+    ranges = numpy.array(selection.ranges, dtype=numpy.uint64)
+    return ranges.reshape(-1, 2)
+
+
+def from_ranges(ranges: numpy.ndarray) -> libsonata.Selection:
+    return libsonata.Selection(ranges.tolist())
+
+
+def get_selection_size(selection: libsonata.Selection) -> int:
+    return RANGE_SIZE * len(selection.ranges)
+
+
+def merge_ranges(ranges: numpy.ndarray) -> numpy.ndarray:
+    ranges = ranges[ranges[:, 0] < ranges[:, 1]]
+    if len(ranges) == 0:
+        return numpy.empty((0, 2), dtype=numpy.uint64)
+    order = numpy.argsort(ranges[:, 0], kind="stable")
+    starts = ranges[order, 0]
+    stops = numpy.maximum.accumulate(ranges[order, 1])
+    gaps = starts[1:] > stops[:-1]
+    first = numpy.concatenate(([True], gaps))
+    last = numpy.concatenate((gaps, [True]))
+    return numpy.stack((starts[first], stops[last]), axis=1)
+
+
+def union(selections: list[libsonata.Selection]) -> libsonata.Selection:
+    if not selections:
+        return libsonata.Selection([])
+    if len(selections) == 1:
+        return selections[0]
+    if sum(selection.flat_size for selection in selections) <= FLAT_SIZE_LIMIT:
+        ids = numpy.unique(numpy.concatenate([selection.flatten() for selection in selections]))
+        return libsonata.Selection(ids.astype(numpy.uint64, copy=False))
+    return reduce(operator.or_, selections)
+
+
+def intersection(selections: list[libsonata.Selection]) -> libsonata.Selection:
+    if not selections:
+        return libsonata.Selection([])
+    ranges = [merge_ranges(get_ranges(selection)) for selection in selections]
+    points = _get_points(ranges)
+    mask = numpy.logical_and.reduce([_cover(item, points[:-1]) for item in ranges])
+    return from_ranges(_get_segments(points, mask))
+
+
+def difference(selection: libsonata.Selection, others: list[libsonata.Selection]) -> libsonata.Selection:
+    ranges = merge_ranges(get_ranges(selection))
+    removed = get_ranges(union(others))
+    points = _get_points([ranges, removed])
+    mask = _cover(ranges, points[:-1]) & ~_cover(removed, points[:-1])
+    return from_ranges(_get_segments(points, mask))
+
+
+def combine_ids(operation: SetOperation, ids: list[numpy.ndarray]) -> numpy.ndarray:
+    if not ids:
+        return numpy.empty(0, dtype=numpy.uint64)
+    ids = [numpy.unique(item) for item in ids]
+    if operation is SetOperation.UNION:
+        return numpy.unique(numpy.concatenate(ids))
+    if operation is SetOperation.INTERSECTION:
+        return reduce(partial(numpy.intersect1d, assume_unique=True), ids)
+    if operation is SetOperation.DIFFERENCE:
+        return reduce(partial(numpy.setdiff1d, assume_unique=True), ids)
+    raise ValueError(f"Unsupported set operation: {operation}")
+
+
+def combine_selections(operation: SetOperation, selections: list[libsonata.Selection]) -> libsonata.Selection:
+    if not selections:
+        return libsonata.Selection([])
+    if sum(selection.flat_size for selection in selections) <= FLAT_SIZE_LIMIT:
+        ids = combine_ids(operation, [selection.flatten() for selection in selections])
+        return libsonata.Selection(ids.astype(numpy.uint64, copy=False))
+    if operation is SetOperation.UNION:
+        return union(selections)
+    if operation is SetOperation.INTERSECTION:
+        return intersection(selections)
+    if operation is SetOperation.DIFFERENCE:
+        return difference(selections[0], selections[1:])
+    raise ValueError(f"Unsupported set operation: {operation}")
+
+
+def _get_points(ranges: list[numpy.ndarray]) -> numpy.ndarray:
+    points = numpy.concatenate([item.reshape(-1) for item in ranges])
+    return numpy.unique(points.astype(numpy.uint64))
+
+
+def _cover(ranges: numpy.ndarray, points: numpy.ndarray) -> numpy.ndarray:
+    indices = numpy.searchsorted(ranges[:, 1], points, side="right")
+    inside = indices < len(ranges)
+    inside[inside] = ranges[indices[inside], 0] <= points[inside]
+    return inside
+
+
+def _get_segments(points: numpy.ndarray, mask: numpy.ndarray) -> numpy.ndarray:
+    segments = numpy.stack((points[:-1][mask], points[1:][mask]), axis=1)
+    return merge_ranges(segments)
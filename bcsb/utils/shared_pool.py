@@ -0,0 +1,43 @@
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class _SharedItem(Generic[V]):
+    value: V
+    count: int = 0
+
+
+class SharedPool(Generic[K, V]):
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._items = dict[K, _SharedItem[V]]()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._items
+
+    def acquire(self, key: K, factory: Callable[[], V]) -> V:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                item = _SharedItem(factory())
+                self._items[key] = item
+            item.count += 1
+            return item.value
+
+    def release(self, key: K) -> None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return
+            item.count -= 1
+            if item.count <= 0:
+                del self._items[key]
@@ -3,6 +3,9 @@ from pathlib import Path
 
 import libsonata
 
+from .file_stamp import FileStamp, get_file_stamp
+from .lru_cache import LruCache
+
 
 @dataclass
 class SonataConfig:
@@ -14,15 +17,66 @@ class SonataConfig:
         return self.circuit.node_sets_path if self.simulation is None else self.simulation.node_sets_file
 
 
+@dataclass
+class _ParsedConfig:
+    config: SonataConfig
+    stamps: dict[Path, FileStamp]
+
+    @property
+    def outdated(self) -> bool:
+        return any(get_file_stamp(path) != stamp for path, stamp in self.stamps.items())
+
+
+@dataclass
+class _ConfigKind:
+    stamp: FileStamp
+    simulation: bool
+
+
+class SonataParser:
+    def __init__(self, max_size: int) -> None:
+        self._configs = LruCache[Path, _ParsedConfig](max_size)
+        self._kinds = dict[Path, _ConfigKind]()
+
+    def parse(self, path: Path) -> SonataConfig:
+        path = path.resolve()
+        parsed = self._configs.get(path)
+        if parsed is None or parsed.outdated:
+            parsed = self._parse(path)
+            self._configs.put(path, parsed)
+        return parsed.config
+
+    def _parse(self, path: Path) -> _ParsedConfig:
+        stamp = get_file_stamp(path)
+        kind = self._kinds.get(path)
+        if kind is None or kind.stamp != stamp:
+            config = parse_sonata_config(path)
+            kind = _ConfigKind(stamp, config.simulation is not None)
+            self._kinds[path] = kind
+        elif kind.simulation:
+            config = _parse_simulation_config(path)
+        else:
+            config = _parse_circuit_config(path)
+        stamps = {path: stamp}
+        if config.simulation is not None:
+            network = Path(config.simulation.network).resolve()
+            stamps[network] = get_file_stamp(network)
+        return _ParsedConfig(config, stamps)
+
+
 def parse_sonata_config(path: Path) -> SonataConfig:
     try:
         return _parse_simulation_config(path)
     except Exception:
-        circuit = libsonata.CircuitConfig.from_file(path)
-        return SonataConfig(circuit)
+        return _parse_circuit_config(path)
 
 
 def _parse_simulation_config(path: Path) -> SonataConfig:
     simulation = libsonata.SimulationConfig.from_file(path)
     circuit = libsonata.CircuitConfig.from_file(simulation.network)
     return SonataConfig(circuit, simulation)
+
+
+def _parse_circuit_config(path: Path) -> SonataConfig:
+    circuit = libsonata.CircuitConfig.from_file(path)
+    return SonataConfig(circuit)
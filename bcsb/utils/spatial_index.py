@@ -0,0 +1,81 @@
+from collections.abc import Callable
+
+import numpy
+
+CELL_CAPACITY = 32
+
+PointTest = Callable[[numpy.ndarray], numpy.ndarray]
+
+
+class SpatialIndex:
+    def __init__(self, positions: numpy.ndarray, cell_capacity: int = CELL_CAPACITY) -> None:
+        self._positions = positions
+        self._lower = positions.min(axis=0).astype(numpy.float64) if len(positions) else numpy.zeros(3)
+        extent = positions.max(axis=0) - self._lower if len(positions) else numpy.zeros(3)
+        self._cell_size = _get_cell_size(extent, len(positions), cell_capacity)
+        shape = numpy.maximum(numpy.ceil(extent / self._cell_size), 1).astype(numpy.int64)
+        cells = numpy.floor((positions.astype(numpy.float64) - self._lower) / self._cell_size).astype(numpy.int64)
+        cells = numpy.minimum(cells, shape - 1)
+        keys = numpy.ravel_multi_index(cells.T, shape)
+        self._order = numpy.argsort(keys)
+        occupied, starts = numpy.unique(keys[self._order], return_index=True)
+        self._starts = numpy.append(starts, len(positions))
+        self._cell_lowers = self._lower + numpy.stack(numpy.unravel_index(occupied, shape), axis=1) * self._cell_size
+
+    @property
+    def positions(self) -> numpy.ndarray:
+        return self._positions
+
+    @property
+    def nbytes(self) -> int:
+        return self._order.nbytes + self._starts.nbytes + self._cell_lowers.nbytes
+
+    def query_box(self, lower: numpy.ndarray, upper: numpy.ndarray) -> numpy.ndarray:
+        cell_uppers = self._cell_lowers + self._cell_size
+        overlap = numpy.all((self._cell_lowers <= upper) & (cell_uppers >= lower), axis=1)
+        inside = numpy.all((self._cell_lowers >= lower) & (cell_uppers <= upper), axis=1)
+        return self._query(overlap, inside, lambda points: numpy.all((points >= lower) & (points <= upper), axis=1))
+
+    def query_sphere(self, center: numpy.ndarray, radius: float) -> numpy.ndarray:
+        cell_uppers = self._cell_lowers + self._cell_size
+        nearest = numpy.clip(center, self._cell_lowers, cell_uppers)
+        farthest = numpy.maximum(numpy.abs(center - self._cell_lowers), numpy.abs(center - cell_uppers))
+        overlap = _squared_norm(nearest - center) <= radius * radius
+        inside = _squared_norm(farthest) <= radius * radius
+        return self._query(overlap, inside, lambda points: _squared_norm(points - center) <= radius * radius)
+
+    def query_planes(self, planes: numpy.ndarray) -> numpy.ndarray:
+        normals, offsets = planes[:, :3], planes[:, 3]
+        positive = self._cell_lowers[:, numpy.newaxis] + self._cell_size * (normals > 0)
+        negative = self._cell_lowers[:, numpy.newaxis] + self._cell_size * (normals < 0)
+        overlap = numpy.all(numpy.einsum("cpk,pk->cp", positive, normals) + offsets >= 0, axis=1)
+        inside = numpy.all(numpy.einsum("cpk,pk->cp", negative, normals) + offsets >= 0, axis=1)
+        return self._query(overlap, inside, lambda points: numpy.all(points @ normals.T + offsets >= 0, axis=1))
+
+    def _query(self, overlap: numpy.ndarray, inside: numpy.ndarray, test: PointTest) -> numpy.ndarray:
+        full = self._gather(overlap & inside)
+        partial = self._gather(overlap & ~inside)
+        partial = partial[test(self._positions[partial])]
+        indices = numpy.concatenate((full, partial))
+        indices.sort()
+        return indices
+
+    def _gather(self, cells: numpy.ndarray) -> numpy.ndarray:
+        cells = numpy.flatnonzero(cells)
+        starts = self._starts[cells]
+        sizes = self._starts[cells + 1] - starts
+        offsets = numpy.repeat(starts - numpy.cumsum(sizes) + sizes, sizes)
+        return self._order[offsets + numpy.arange(len(offsets))]
+
+
+def _get_cell_size(extent: numpy.ndarray, count: int, cell_capacity: int) -> float:
+    spread = extent > 0
+    if count == 0 or not spread.any():
+        return 1.0
+    volume = numpy.prod(extent[spread].astype(numpy.float64))
+    cell_count = max(count / cell_capacity, 1.0)
+    return float((volume / cell_count) ** (1 / numpy.count_nonzero(spread)))
+
+
+def _squared_norm(vectors: numpy.ndarray) -> numpy.ndarray:
+    return numpy.einsum("ij,ij->i", vectors, vectors)
@@ -0,0 +1,89 @@
+import math
+
+import numpy
+
+MAX_INTENSITY = 255
+
+
+class SpikeActivity:
+    def __init__(
+        self,
+        node_ids: numpy.ndarray,
+        spike_node_ids: numpy.ndarray,
+        spike_times: numpy.ndarray,
+        dt: float,
+        decay: float,
+    ) -> None:
+        if dt <= 0:
+            raise ValueError(f"Invalid spike frame delta {dt}")
+        if decay <= 0:
+            raise ValueError(f"Invalid spike decay {decay}")
+        self._node_count = len(node_ids)
+        self._dt = dt
+        self._decay = decay
+        self._window = decay * math.log(256)
+        indices = _get_node_indices(node_ids, spike_node_ids)
+        selected = indices >= 0
+        times = spike_times[selected]
+        indices = indices[selected]
+        if numpy.any(times[1:] < times[:-1]):
+            order = numpy.argsort(times)
+            times = times[order]
+            indices = indices[order]
+        self._times = times
+        self._indices = indices
+
+    @property
+    def node_count(self) -> int:
+        return self._node_count
+
+    @property
+    def spike_count(self) -> int:
+        return len(self._times)
+
+    @property
+    def nbytes(self) -> int:
+        return self._times.nbytes + self._indices.nbytes
+
+    def read_frame(self, frame: int) -> numpy.ndarray:
+        return self.read_frames(frame, frame + 1)[0]
+
+    def read_frames(self, start: int, stop: int, stride: int = 1, chunk_size: int = 2**24) -> numpy.ndarray:
+        frame_times = numpy.arange(start, stop, stride) * self._dt
+        result = numpy.zeros((len(frame_times), self._node_count), dtype=numpy.uint8)
+        if not len(frame_times):
+            return result
+        begin = numpy.searchsorted(self._times, frame_times[0] - self._window, side="right")
+        end = numpy.searchsorted(self._times, frame_times[-1], side="right")
+        frames_per_spike = math.ceil(self._window / (self._dt * stride)) + 1
+        spikes_per_chunk = max(chunk_size // frames_per_spike, 1)
+        for first in range(begin, end, spikes_per_chunk):
+            last = min(first + spikes_per_chunk, end)
+            self._add_spikes(result, frame_times, self._times[first:last], self._indices[first:last])
+        return result
+
+    def _add_spikes(
+        self, result: numpy.ndarray, frame_times: numpy.ndarray, times: numpy.ndarray, indices: numpy.ndarray
+    ) -> None:
+        firsts = numpy.searchsorted(frame_times, times, side="left")
+        lasts = numpy.searchsorted(frame_times, times + self._window, side="right")
+        counts = lasts - firsts
+        offsets = numpy.cumsum(counts) - counts
+        frames = numpy.repeat(firsts - offsets, counts) + numpy.arange(int(counts.sum()))
+        intensity = (numpy.repeat(times, counts) - frame_times[frames]).astype(numpy.float32)
+        intensity /= self._decay
+        numpy.exp(intensity, out=intensity)
+        intensity *= MAX_INTENSITY
+        keys = frames * self._node_count + numpy.repeat(indices, counts)
+        numpy.maximum.at(result.reshape(-1), keys, intensity.astype(numpy.uint8))
+
+
+def _get_node_indices(node_ids: numpy.ndarray, spike_node_ids: numpy.ndarray) -> numpy.ndarray:
+    if len(node_ids) == 0:
+        return numpy.full(len(spike_node_ids), -1, dtype=numpy.int64)
+    lookup = numpy.full(int(node_ids.max()) + 1, -1, dtype=numpy.int64)
+    lookup[node_ids] = numpy.arange(len(node_ids))
+    inside = spike_node_ids < len(lookup)
+    indices = numpy.full(len(spike_node_ids), -1, dtype=numpy.int64)
+    indices[inside] = lookup[spike_node_ids[inside]]
+    return indices
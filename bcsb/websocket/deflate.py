@@ -0,0 +1,44 @@
+from collections.abc import Sequence
+
+from websockets.extensions.base import Extension
+from websockets.extensions.permessage_deflate import (
+    PerMessageDeflate,
+    ServerPerMessageDeflateFactory,
+)
+from websockets.frames import OP_BINARY, OP_TEXT, Frame
+from websockets.typing import ExtensionParameter
+
+
+class ThresholdDeflate(PerMessageDeflate):
+    def __init__(self, extension: PerMessageDeflate, threshold: int) -> None:
+        super().__init__(
+            extension.remote_no_context_takeover,
+            extension.local_no_context_takeover,
+            extension.remote_max_window_bits,
+            extension.local_max_window_bits,
+            extension.compress_settings,
+        )
+        self.threshold = threshold
+
+    def encode(self, frame: Frame) -> Frame:
+        if frame.opcode in (OP_TEXT, OP_BINARY) and frame.fin and len(frame.data) < self.threshold:
+            return frame
+        return super().encode(frame)
+
+
+class ThresholdDeflateFactory(ServerPerMessageDeflateFactory):
+    def __init__(self, threshold: int) -> None:
+        super().__init__(
+            server_max_window_bits=12,
+            client_max_window_bits=12,
+            compress_settings={"memLevel": 5},
+        )
+        self.threshold = threshold
+
+    def process_request_params(
+        self,
+        params: Sequence[ExtensionParameter],
+        accepted_extensions: Sequence[Extension],
+    ) -> tuple[list[ExtensionParameter], PerMessageDeflate]:
+        response, extension = super().process_request_params(params, accepted_extensions)
+        return response, ThresholdDeflate(extension, self.threshold)
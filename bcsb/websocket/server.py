@@ -7,6 +7,7 @@ from websockets.datastructures import Headers, HeadersLike
 from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 from websockets.server import WebSocketServer, WebSocketServerProtocol, serve
 
+from .deflate import ThresholdDeflateFactory
 from .interface import (
     Connection,
     ConnectionClosed,
@@ -81,6 +82,9 @@ class WebServer(Server):
         port: int,
         ssl: SSLContext | None,
         max_frame_size: int,
+        compression_threshold: int | None = None,
+        ping_interval: float | None = None,
+        ping_timeout: float | None = None,
     ) -> None:
         self._handler = handler
         self._monitor = monitor
@@ -89,6 +93,9 @@ class WebServer(Server):
         self._port = port
         self._ssl = ssl
         self._max_frame_size = max_frame_size
+        self._compression_threshold = compression_threshold
+        self._ping_interval = ping_interval
+        self._ping_timeout = ping_timeout
 
     @property
     def host(self) -> str:
@@ -105,6 +112,9 @@ class WebServer(Server):
 
     async def _start(self) -> WebSocketServer:
         self._logger.info("Starting server on %s.", self.url)
+        extensions = []
+        if self._compression_threshold is not None:
+            extensions.append(ThresholdDeflateFactory(self._compression_threshold))
         try:
             return await serve(
                 self._handle,
@@ -112,8 +122,11 @@ class WebServer(Server):
                 self._port,
                 ssl=self._ssl,
                 max_size=self._max_frame_size,
-                ping_interval=None,
+                ping_interval=self._ping_interval,
+                ping_timeout=self._ping_timeout,
                 process_request=self._process_request,
+                compression=None,
+                extensions=extensions,
             )
         except Exception as e:
             self._logger.error("Failed to start server: %s.", e)
@@ -15,6 +15,10 @@ class MockEnum(Enum):
     TEST2 = "test2"
 
 
+class MockColor(Enum):
+    RED = "red"
+
+
 @dataclass
 class MockDataclass:
     boolean: bool
@@ -39,6 +43,17 @@ class Union2:
     value2: int
 
 
+@dataclass
+class Union3:
+    value3: float
+    key: Literal["test3"] = "test3"
+
+
+@dataclass
+class Late:
+    value: int
+
+
 def deserialize_custom(value: dict[str, Any], t: type[Custom]) -> Custom:
     arg = get_args(t)[0]
     return t(arg(value["value"]))
@@ -103,3 +118,36 @@ def test_oneof() -> None:
     data = {"key": "test2", "value3": 1}
     with pytest.raises(ValueError):
         deserialize(data, Union1 | Union2)
+
+
+def test_oneof_json_types() -> None:
+    assert deserialize(1, int | float) == 1
+    assert isinstance(deserialize(1, float | int), int)
+    assert isinstance(deserialize(1, float | None), float)
+    assert deserialize(None, list[int] | None) is None
+    assert deserialize([1, 2], list[int] | None) == [1, 2]
+    assert deserialize("test1", MockEnum | int) is MockEnum.TEST1
+    assert deserialize(["a", 1], list[str | int]) == ["a", 1]
+    with pytest.raises(ValueError):
+        deserialize("test", int | None)
+
+
+def test_oneof_fallback() -> None:
+    assert deserialize("test1", MockEnum | str) == "test1"
+    assert deserialize("other", MockEnum | str) == "other"
+    assert deserialize("red", MockEnum | MockColor) is MockColor.RED
+    with pytest.raises(ValueError):
+        deserialize("other", MockEnum | MockColor)
+
+
+def test_oneof_discriminator() -> None:
+    assert deserialize({"value3": 1}, Union1 | Union3) == Union3(1)
+    assert deserialize({"key": "test3", "value3": 2}, Union2 | Union3) == Union3(2)
+    with pytest.raises(ValueError):
+        deserialize({"key": "test1"}, Union1 | Union3)
+
+
+def test_late_custom() -> None:
+    assert deserialize([{"value": 1}], list[Late]) == [Late(1)]
+    add_deserializer(Late, lambda data, t: t(data))
+    assert deserialize([2], list[Late]) == [Late(2)]
@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Generic, TypeVar
 
+import pytest
+
 from bcsb.json.serialization import add_serializer, serialize
 
 T = TypeVar("T")
@@ -19,6 +21,18 @@ class MockDataclass:
     string: str
 
 
+@dataclass
+class MockOptional:
+    required: int | None
+    optional: str | None = None
+    items: list[MockDataclass] = field(default_factory=list)
+
+
+@dataclass
+class Late:
+    value: int
+
+
 @dataclass
 class Custom(Generic[T]):
     value: T
@@ -66,3 +80,30 @@ def test_custom() -> None:
     assert serialize(Custom[int](3)) == "3"
     assert serialize(Custom[float](1.5)) == "1.5"
     assert serialize(Custom[str]("test")) == "test"
+
+
+def test_nested() -> None:
+    value = MockOptional(None, items=[MockDataclass(True, 1, "a"), MockDataclass(False, 2, "b")])
+    ref = {
+        "required": None,
+        "items": [
+            {"boolean": True, "integer": 1, "string": "a"},
+            {"boolean": False, "integer": 2, "string": "b"},
+        ],
+    }
+    assert serialize(value) == ref
+    assert serialize(MockOptional(1, "test")) == {"required": 1, "optional": "test", "items": []}
+    assert serialize({"key": [MockEnum.TEST2, (1, None)]}) == {"key": ["test2", [1, None]]}
+
+
+def test_late_custom() -> None:
+    assert serialize(Late(1)) == {"value": 1}
+    add_serializer(Late, lambda value: value.value)
+    assert serialize([Late(2)]) == [2]
+
+
+def test_unsupported() -> None:
+    with pytest.raises(ValueError):
+        serialize(object())
+    with pytest.raises(ValueError):
+        serialize([1, object()])
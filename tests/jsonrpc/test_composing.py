@@ -9,6 +9,7 @@ from bcsb.jsonrpc.composing import (
 )
 from bcsb.jsonrpc.messages import (
     JSON_RPC_VERSION,
+    Compression,
     JsonRpcError,
     JsonRpcErrorInfo,
     JsonRpcReply,
@@ -64,3 +65,18 @@ def test_compose_result() -> None:
     assert json.loads(data) == {"result": 3, "jsonrpc": JSON_RPC_VERSION}
     data = compose_result(reply.result, reply.id, reply.binary)
     assert data == compose_reply(reply)
+
+
+def test_compose_compressed_result() -> None:
+    compression = Compression("zlib", 10, 2)
+    data = compose_result(3, 1, b"123", compression)
+    assert isinstance(data, bytes)
+    size = int.from_bytes(data[:4], "little")
+    text = data[4 : size + 4]
+    assert json.loads(text) == {
+        "id": 1,
+        "result": 3,
+        "jsonrpc": JSON_RPC_VERSION,
+        "compression": {"method": "zlib", "size": 10, "shuffle": 2},
+    }
+    assert data[size + 4 :] == b"123"
@@ -0,0 +1,38 @@
+import os
+
+import numpy
+import pytest
+
+from bcsb.jsonrpc.compression import compress_binary, decompress_binary
+from bcsb.jsonrpc.messages import Compression
+
+
+def test_compress_typed_array() -> None:
+    ids = numpy.arange(100000, dtype="<u8")
+    binary = ids.data
+    compressed, compression = compress_binary(binary)
+    assert compression == Compression("zlib", ids.nbytes, 8)
+    assert len(compressed) < ids.nbytes // 10
+    assert decompress_binary(compressed, compression) == ids.tobytes()
+
+
+def test_compress_bytes() -> None:
+    binary = b"abc" * 1000
+    compressed, compression = compress_binary(binary)
+    assert compression == Compression("zlib", len(binary), 1)
+    assert decompress_binary(compressed, compression) == binary
+
+
+def test_incompressible() -> None:
+    binary = os.urandom(1000)
+    compressed, compression = compress_binary(binary)
+    assert compression is None
+    assert compressed is binary
+
+
+def test_invalid_compression() -> None:
+    compressed, _ = compress_binary(b"abc" * 1000)
+    with pytest.raises(ValueError):
+        decompress_binary(compressed, Compression("lz4", 3000))
+    with pytest.raises(ValueError):
+        decompress_binary(compressed, Compression("zlib", 10))
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from logging import Logger
 from typing import Any
 
+import pytest
+
 from bcsb.json import JsonSchema
 from bcsb.jsonrpc import (
     Endpoint,
@@ -13,6 +15,7 @@ from bcsb.jsonrpc import (
     EndpointSchema,
     InternalError,
     JsonRpcHandler,
+    get_session,
 )
 from bcsb.jsonrpc.exceptions import INTERNAL_ERROR, PARSE_ERROR
 from bcsb.jsonrpc.messages import JSON_RPC_VERSION
@@ -59,6 +62,17 @@ class RaiseHandler(EndpointHandler):
         raise InternalError("This is a test")
 
 
+@dataclass
+class SessionHandler(EndpointHandler):
+    sessions: list[int] = field(default_factory=list)
+
+    async def handle(self, params: EndpointParams) -> EndpointResult:
+        session = get_session()
+        session.values["count"] = session.values.get("count", 0) + 1
+        self.sessions.append(session.id)
+        return EndpointResult(session.values["count"], b"")
+
+
 def mock_connection() -> MockConnection:
     return MockConnection(
         requests=[
@@ -118,3 +132,59 @@ def test_handle() -> None:
     asyncio.run(test.handle(connection))
     assert handler.params == expected_params()
     assert connection.replies == expected_replies()
+
+
+def test_sessions() -> None:
+    handler = SessionHandler()
+    endpoints = {"session": Endpoint(mock_schema(), handler)}
+    test = JsonRpcHandler(endpoints, Logger("Test"))
+    request = json.dumps({"id": 0, "method": "session"})
+    first = MockConnection([request, request])
+    second = MockConnection([request])
+    asyncio.run(test.handle(first))
+    asyncio.run(test.handle(second))
+    assert [reply["result"] for reply in first.replies] == [1, 2]
+    assert [reply["result"] for reply in second.replies] == [1]
+    assert handler.sessions[0] == handler.sessions[1]
+    assert handler.sessions[1] != handler.sessions[2]
+    with pytest.raises(InternalError):
+        get_session()
+
+
+@dataclass
+class CleanupHandler(EndpointHandler):
+    cleanups: list[int] = field(default_factory=list)
+
+    async def handle(self, params: EndpointParams) -> EndpointResult:
+        session = get_session()
+        session.add_cleanup(lambda: self.cleanups.append(session.id))
+        return EndpointResult(None, b"")
+
+
+class IdleConnection(MockConnection):
+    async def receive(self) -> bytes | str:
+        if not self.requests:
+            await asyncio.Event().wait()
+        return self.requests.pop(0)
+
+
+def test_session_cleanup() -> None:
+    handler = CleanupHandler()
+    endpoints = {"cleanup": Endpoint(mock_schema(), handler)}
+    test = JsonRpcHandler(endpoints, Logger("Test"))
+    request = json.dumps({"id": 0, "method": "cleanup"})
+    connection = MockConnection([request, request])
+    asyncio.run(test.handle(connection))
+    assert len(connection.replies) == 2
+    assert len(handler.cleanups) == 2
+    assert handler.cleanups[0] == handler.cleanups[1]
+
+
+def test_idle_timeout() -> None:
+    handler = CleanupHandler()
+    endpoints = {"cleanup": Endpoint(mock_schema(), handler)}
+    test = JsonRpcHandler(endpoints, Logger("Test"), idle_timeout=0.01)
+    connection = IdleConnection([json.dumps({"id": 0, "method": "cleanup"})])
+    asyncio.run(test.handle(connection))
+    assert len(connection.replies) == 1
+    assert len(handler.cleanups) == 1
@@ -0,0 +1,78 @@
+import asyncio
+import os
+import threading
+from contextvars import ContextVar
+
+import pytest
+
+from bcsb.service import Execution, Executors
+from bcsb.service.execution import check_execution
+
+VALUE = ContextVar[str]("value", default="")
+
+
+async def get_thread(value: int) -> tuple[int, str, str]:
+    return value, threading.current_thread().name, VALUE.get()
+
+
+async def get_process(value: int) -> tuple[int, int]:
+    return value, os.getpid()
+
+
+async def run_in(executors: Executors, execution: Execution) -> tuple[int, str, str]:
+    VALUE.set("test")
+    return await executors.run(execution, get_thread, 1)
+
+
+def test_inline() -> None:
+    executors = Executors(1, 1)
+    result = asyncio.run(run_in(executors, Execution.INLINE))
+    assert result == (1, threading.current_thread().name, "test")
+
+
+def test_thread() -> None:
+    executors = Executors(1, 1)
+    value, name, context = asyncio.run(run_in(executors, Execution.THREAD))
+    executors.shutdown()
+    assert value == 1
+    assert name != threading.current_thread().name
+    assert context == "test"
+
+
+def test_process() -> None:
+    executors = Executors(1, 1)
+    value, pid = asyncio.run(executors.run(Execution.PROCESS, get_process, 2))
+    executors.shutdown()
+    assert value == 2
+    assert pid != os.getpid()
+
+
+class Handler:
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+
+    async def get(self, value: int) -> int:
+        return value
+
+
+def test_check_execution() -> None:
+    check_execution(Execution.PROCESS, get_process)
+    check_execution(Execution.THREAD, Handler().get)
+    with pytest.raises(ValueError):
+        check_execution(Execution.PROCESS, Handler().get)
+    with pytest.raises(ValueError):
+        check_execution(Execution.PROCESS, lambda value: value)
+
+
+async def get_loop(value: int) -> tuple[int, int]:
+    return value, id(asyncio.get_running_loop())
+
+
+def test_thread_loop_reused() -> None:
+    executors = Executors(1, 1)
+    first = asyncio.run(executors.run(Execution.THREAD, get_loop, 1))
+    second = asyncio.run(executors.run(Execution.THREAD, get_loop, 2))
+    executors.shutdown()
+    assert first[0] == 1
+    assert second[0] == 2
+    assert first[1] == second[1]
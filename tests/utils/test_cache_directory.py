@@ -0,0 +1,32 @@
+import os
+from pathlib import Path
+
+from bcsb.utils.cache_directory import mark_used, prune_directory
+
+
+def write(path: Path, size: int, mtime: float) -> None:
+    path.write_bytes(bytes(size))
+    os.utime(path, (mtime, mtime))
+
+
+def test_prune_directory(tmp_path: Path) -> None:
+    write(tmp_path / "a.npy", 100, 1)
+    write(tmp_path / "a.json", 10, 4)
+    write(tmp_path / "b.npy", 100, 2)
+    write(tmp_path / "c.npz", 100, 3)
+    write(tmp_path / "d.npz.1.2.tmp", 1000, 0)
+    prune_directory(tmp_path, 300)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.json", "a.npy", "c.npz", "d.npz.1.2.tmp"]
+    prune_directory(tmp_path, 110)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.json", "a.npy", "d.npz.1.2.tmp"]
+    prune_directory(tmp_path, 0)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["d.npz.1.2.tmp"]
+
+
+def test_mark_used(tmp_path: Path) -> None:
+    write(tmp_path / "a.npy", 100, 1)
+    write(tmp_path / "b.npy", 100, 2)
+    mark_used(tmp_path / "a.npy")
+    prune_directory(tmp_path, 100)
+    assert [path.name for path in tmp_path.iterdir()] == ["a.npy"]
+    mark_used(tmp_path / "missing" / "c.npy")
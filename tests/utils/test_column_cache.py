@@ -0,0 +1,59 @@
+import os
+from pathlib import Path
+
+import numpy
+
+from bcsb.utils.column_cache import ColumnCache
+from bcsb.utils.columns import Column
+
+
+def test_numeric_column(tmp_path: Path) -> None:
+    cache = ColumnCache(tmp_path, 2**20)
+    assert cache.load("key", "x") is None
+    values = numpy.array([1.5, 2.5, 3.5])
+    cache.save("key", Column("x", values))
+    column = cache.load("key", "x")
+    assert column is not None
+    assert column.name == "x"
+    assert isinstance(column.values, numpy.memmap)
+    assert numpy.array_equal(column.values, values)
+    assert column.dictionary == []
+    assert cache.load("other", "x") is None
+
+
+def test_dictionary_column(tmp_path: Path) -> None:
+    cache = ColumnCache(tmp_path, 2**20)
+    codes = numpy.array([1, 0, 1], dtype=numpy.uint8)
+    cache.save("key", Column("mtype", codes, ["a", "b"]))
+    column = cache.load("key", "mtype")
+    assert column is not None
+    assert column.values.dtype == numpy.uint8
+    assert numpy.array_equal(column.values, codes)
+    assert column.dictionary == ["a", "b"]
+    assert sorted(path.suffix for path in (tmp_path / "columns").iterdir()) == [".json", ".npy"]
+
+
+def test_size_limit(tmp_path: Path) -> None:
+    cache = ColumnCache(tmp_path, 2000)
+    values = numpy.zeros(100)
+    cache.save("first", Column("x", values, ["a"]))
+    cache.save("second", Column("x", values))
+    for index, path in enumerate(sorted((tmp_path / "columns").iterdir())):
+        os.utime(path, (index, index))
+    assert cache.load("first", "x") is not None
+    cache.save("third", Column("x", values))
+    assert cache.load("second", "x") is None
+    assert cache.load("first", "x") is not None
+    assert cache.load("third", "x") is not None
+    assert len(list((tmp_path / "columns").iterdir())) == 4
+
+
+def test_missing_files(tmp_path: Path) -> None:
+    cache = ColumnCache(tmp_path, 2**20)
+    cache.save("key", Column("mtype", numpy.array([1, 0], dtype=numpy.uint8), ["a", "b"]))
+    json_path = next((tmp_path / "columns").glob("*.json"))
+    json_path.unlink()
+    assert cache.load("key", "mtype") is None
+    cache.save("key", Column("mtype", numpy.array([1, 0], dtype=numpy.uint8), ["a", "b"]))
+    next((tmp_path / "columns").glob("*.npy")).unlink()
+    assert cache.load("key", "mtype") is None
@@ -0,0 +1,51 @@
+import numpy
+
+from bcsb.utils.columns import Column, PackedColumn, encode_dictionary, narrow_codes, pack_columns, select_column
+
+
+def test_narrow_codes() -> None:
+    codes = numpy.array([0, 1, 2], dtype=numpy.uint32)
+    assert narrow_codes(codes, 3).dtype == numpy.uint8
+    assert narrow_codes(codes, 256).dtype == numpy.uint8
+    assert narrow_codes(codes, 257).dtype == numpy.uint16
+    assert narrow_codes(codes, 2**16 + 1).dtype == numpy.uint32
+    assert narrow_codes(codes, 2**32 + 1).dtype == numpy.uint64
+
+
+def test_encode_dictionary() -> None:
+    values = numpy.array(["b", "a", "b", "c"], dtype=object)
+    column = encode_dictionary("test", values)
+    assert column.name == "test"
+    assert column.values.tolist() == [1, 0, 1, 2]
+    assert column.values.dtype == numpy.uint8
+    assert column.dictionary == ["a", "b", "c"]
+
+
+def test_pack_columns() -> None:
+    columns = [
+        Column("codes", numpy.array([1, 0, 1], dtype=numpy.uint8), ["a", "b"]),
+        Column("x", numpy.array([1.5, 2.5, 3.5])),
+        Column("layer", numpy.array([1, 2, 3], dtype=numpy.int32)),
+    ]
+    packed, binary = pack_columns(columns)
+    assert packed == [
+        PackedColumn("codes", "uint8", 0, 3, ["a", "b"]),
+        PackedColumn("x", "float64", 8, 3, []),
+        PackedColumn("layer", "int32", 32, 3, []),
+    ]
+    assert len(binary) == 48
+    for column, info in zip(columns, packed):
+        values = numpy.frombuffer(binary, info.dtype, info.count, info.offset)
+        assert numpy.array_equal(values, column.values)
+
+
+def test_select_column() -> None:
+    column = Column("x", numpy.array([1.5, 2.5, 3.5]))
+    selected = select_column(column, numpy.array([2, 0]))
+    assert selected.values.tolist() == [3.5, 1.5]
+    assert selected.dictionary == []
+    column = Column("codes", numpy.array([3, 0, 3, 1, 2], dtype=numpy.uint16), ["a", "b", "c", "d"])
+    selected = select_column(column, numpy.array([4, 2, 0]))
+    assert selected.values.tolist() == [0, 1, 1]
+    assert selected.values.dtype == numpy.uint8
+    assert selected.dictionary == ["c", "d"]
@@ -0,0 +1,95 @@
+import numpy
+
+from bcsb.utils.connectivity import (
+    count_group_pairs,
+    count_pattern_pairs,
+    get_membership_patterns,
+    pack_connectivity,
+    project_patterns,
+)
+
+
+def test_pack_connectivity() -> None:
+    node_ids = numpy.array([7, 2, 5], dtype=numpy.uint64)
+    edge_nodes = numpy.array([2, 7, 2, 7, 2, 7], dtype=numpy.uint64)
+    edge_partners = numpy.array([9, 3, 1, 3, 9, 0], dtype=numpy.uint64)
+    offsets, nodes = pack_connectivity(node_ids, edge_nodes, edge_partners, 10)
+    assert offsets.name == "offsets"
+    assert offsets.values.tolist() == [0, 3, 6, 6]
+    assert nodes.values.tolist() == [0, 3, 3, 1, 9, 9]
+    assert nodes.values.dtype == numpy.uint8
+
+
+def test_pack_connectivity_counts() -> None:
+    node_ids = numpy.array([7, 2, 5], dtype=numpy.uint64)
+    edge_nodes = numpy.array([2, 7, 2, 7, 2, 7], dtype=numpy.uint64)
+    edge_partners = numpy.array([9, 3, 1, 3, 9, 0], dtype=numpy.uint64)
+    offsets, nodes, counts = pack_connectivity(node_ids, edge_nodes, edge_partners, 1000, counts=True)
+    assert offsets.values.tolist() == [0, 2, 4, 4]
+    assert nodes.values.tolist() == [0, 3, 1, 9]
+    assert nodes.values.dtype == numpy.uint16
+    assert counts.values.tolist() == [1, 2, 1, 2]
+
+
+def test_pack_connectivity_empty() -> None:
+    empty = numpy.empty(0, dtype=numpy.uint64)
+    offsets, nodes, counts = pack_connectivity(numpy.array([1, 2], dtype=numpy.uint64), empty, empty, 10, True)
+    assert offsets.values.tolist() == [0, 0, 0]
+    assert len(nodes.values) == 0
+    assert len(counts.values) == 0
+
+
+def test_get_membership_patterns() -> None:
+    groups = [numpy.array([0, 1, 2]), numpy.array([2, 3]), numpy.array([], dtype=numpy.int64)]
+    patterns, membership = get_membership_patterns(5, groups)
+    rows = membership[patterns].tolist()
+    assert rows == [[1, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 0]]
+    assert len(membership) == 4
+    patterns, membership = get_membership_patterns(3, [])
+    assert patterns.tolist() == [0, 0, 0]
+    assert membership.shape == (1, 0)
+
+
+def test_connectivity_matrix() -> None:
+    generator = numpy.random.default_rng(0)
+    sources = generator.integers(0, 50, 2000)
+    targets = generator.integers(0, 40, 2000)
+    source_groups = [generator.choice(50, 20, replace=False) for _ in range(3)]
+    target_groups = [generator.choice(40, 15, replace=False) for _ in range(10)]
+    source_patterns, source_membership = get_membership_patterns(50, source_groups)
+    target_patterns, target_membership = get_membership_patterns(40, target_groups)
+    shape = (len(source_membership), len(target_membership))
+    counts = count_pattern_pairs(source_patterns[sources], target_patterns[targets], shape)
+    matrix = project_patterns(counts, source_membership, target_membership)
+    expected = [
+        [numpy.count_nonzero(numpy.isin(sources, row) & numpy.isin(targets, column)) for column in target_groups]
+        for row in source_groups
+    ]
+    assert matrix.tolist() == expected
+
+
+def test_get_membership_patterns_many_groups() -> None:
+    generator = numpy.random.default_rng(0)
+    groups = [generator.choice(500, 50, replace=False) for _ in range(70)]
+    patterns, membership = get_membership_patterns(500, groups)
+    rows = membership[patterns]
+    for index, ids in enumerate(groups):
+        assert numpy.flatnonzero(rows[:, index]).tolist() == sorted(ids.tolist())
+
+
+def test_count_group_pairs() -> None:
+    generator = numpy.random.default_rng(1)
+    source_groups = [generator.choice(50, 20, replace=False) for _ in range(3)]
+    target_groups = [generator.choice(40, 15, replace=False) for _ in range(2)]
+    sources = generator.integers(0, 50, 300)
+    targets = generator.integers(0, 40, 300)
+    source_patterns, source_membership = get_membership_patterns(50, source_groups)
+    target_patterns, target_membership = get_membership_patterns(40, target_groups)
+    shape = (len(source_membership), len(target_membership))
+    counts = count_pattern_pairs(source_patterns[sources], target_patterns[targets], shape)
+    expected = project_patterns(counts, source_membership, target_membership)
+    matrix = count_group_pairs(
+        source_membership[source_patterns[sources]], target_membership[target_patterns[targets]]
+    )
+    assert matrix.dtype == numpy.int64
+    assert numpy.array_equal(matrix, expected)
@@ -0,0 +1,41 @@
+import numpy
+import pytest
+
+from bcsb.utils.encoding import Encoding, encode_deltas, encode_values, is_quantized
+
+
+def test_encode_values() -> None:
+    values = numpy.array([-1, 0, 0.5, 1, 2], dtype=numpy.float32)
+    assert encode_values(values, Encoding.UINT8, 0, 1).tolist() == [0, 0, 127, 255, 255]
+    assert encode_values(values, Encoding.UINT16, 0, 1).tolist() == [0, 0, 32767, 65535, 65535]
+    assert encode_values(values, Encoding.FLOAT16, 0, 0).dtype == numpy.float16
+    assert encode_values(values, Encoding.FLOAT32, 0, 0) is values
+    with pytest.raises(ValueError):
+        encode_values(values, Encoding.UINT8, 1, 1)
+
+
+def test_is_quantized() -> None:
+    assert is_quantized(Encoding.UINT8)
+    assert is_quantized(Encoding.UINT16)
+    assert not is_quantized(Encoding.FLOAT16)
+    assert not is_quantized(Encoding.FLOAT32)
+
+
+def test_encode_deltas() -> None:
+    frames = numpy.array([[3, 250], [1, 5], [1, 5]], dtype=numpy.uint8)
+    previous = numpy.array([2, 10], dtype=numpy.uint8)
+    deltas, last = encode_deltas(frames, previous)
+    assert deltas.tolist() == [[1, 240], [254, 11], [0, 0]]
+    assert last.tolist() == [1, 5]
+    assert previous.tolist() == [2, 10]
+
+
+def test_encode_float_deltas() -> None:
+    generator = numpy.random.default_rng(0)
+    frames = generator.uniform(-80, 20, (10, 100)).astype(numpy.float16)
+    previous = numpy.zeros(100, dtype=numpy.float16)
+    deltas, last = encode_deltas(frames, previous)
+    for delta in deltas:
+        previous = previous + delta
+    assert numpy.array_equal(previous, last)
+    assert numpy.allclose(last, frames[-1], atol=0.1)
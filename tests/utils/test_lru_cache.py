@@ -0,0 +1,40 @@
+from bcsb.utils.lru_cache import LruCache
+
+
+def test_get() -> None:
+    cache = LruCache[str, int](2)
+    assert cache.get("a") is None
+    assert cache.put("a", 1) == []
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert len(cache) == 1
+
+
+def test_evict() -> None:
+    cache = LruCache[str, int](2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    assert cache.put("c", 3) == [("b", 2)]
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_size() -> None:
+    cache = LruCache[str, list[int]](5, len)
+    cache.put("a", [1, 2])
+    cache.put("b", [1, 2, 3])
+    assert cache.size == 5
+    assert cache.put("c", [1]) == [("a", [1, 2])]
+    assert cache.size == 4
+    assert cache.put("d", [1, 2, 3, 4, 5, 6]) == [("b", [1, 2, 3]), ("c", [1]), ("d", [1, 2, 3, 4, 5, 6])]
+    assert cache.size == 0
+
+
+def test_remove() -> None:
+    cache = LruCache[str, int](2)
+    cache.put("a", 1)
+    assert cache.remove("a") == 1
+    assert cache.remove("a") is None
+    assert cache.size == 0
@@ -0,0 +1,41 @@
+from bcsb.utils.memory_budget import MemoryBudget
+
+
+def test_add() -> None:
+    budget = MemoryBudget[str](10)
+    assert budget.add("a", 4) == []
+    assert budget.add("b", 4) == []
+    assert budget.size == 8
+    assert budget.add("c", 4) == ["a"]
+    assert budget.size == 8
+    assert "a" not in budget
+    assert len(budget) == 2
+    assert budget.max_size == 10
+
+
+def test_touch() -> None:
+    budget = MemoryBudget[str](10)
+    budget.add("a", 4)
+    budget.add("b", 4)
+    budget.touch("a")
+    budget.touch("unknown")
+    assert budget.add("c", 4) == ["b"]
+
+
+def test_remove() -> None:
+    budget = MemoryBudget[str](10)
+    budget.add("a", 4)
+    budget.add("a", 6)
+    assert budget.size == 6
+    budget.remove("a")
+    budget.remove("a")
+    assert budget.size == 0
+    assert len(budget) == 0
+
+
+def test_oversized() -> None:
+    budget = MemoryBudget[str](10)
+    budget.add("a", 4)
+    assert budget.add("b", 20) == ["a"]
+    assert "b" in budget
+    assert budget.size == 20
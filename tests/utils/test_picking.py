@@ -1,4 +1,13 @@
-from bcsb.utils.picking import pick
+import numpy
+
+from bcsb.utils.picking import (
+    Sampling,
+    get_even_indices,
+    get_random_indices,
+    get_spatial_indices,
+    pick,
+    pick_array,
+)
 
 
 def test_empty() -> None:
@@ -16,3 +25,41 @@ def test_samples() -> None:
     assert pick([1, 2, 3, 4], 2) == [2, 3]
     assert pick([1, 2, 3, 4], 1) == [3]
     assert pick([i + 1 for i in range(10)], 5) == [2, 3, 5, 7, 9]
+
+
+def test_even_indices() -> None:
+    for total in range(30):
+        items = list(range(total))
+        for count in range(-1, total + 2):
+            assert get_even_indices(total, count).tolist() == pick(items, count)
+
+
+def test_random_indices() -> None:
+    indices = get_random_indices(100, 10, seed=1)
+    assert len(set(indices.tolist())) == 10
+    assert indices.tolist() == sorted(indices.tolist())
+    assert get_random_indices(100, 10, seed=1).tolist() == indices.tolist()
+    assert get_random_indices(3, 5, seed=1).tolist() == [0, 1, 2]
+    assert get_random_indices(3, 0, seed=1).tolist() == []
+
+
+def test_pick_array() -> None:
+    items = numpy.arange(10, 20)
+    assert pick_array(items, 5).tolist() == pick(items.tolist(), 5)
+    assert pick_array(items, 20).tolist() == items.tolist()
+    sample = pick_array(items, 4, Sampling.RANDOM, seed=2)
+    assert set(sample.tolist()) <= set(items.tolist())
+    assert len(sample) == 4
+
+
+def test_spatial_indices() -> None:
+    dense = numpy.random.default_rng(0).uniform(0, 1, (900, 3))
+    sparse = numpy.random.default_rng(1).uniform(9, 10, (100, 3))
+    positions = numpy.concatenate((dense, sparse))
+    indices = get_spatial_indices(positions, 100, seed=0)
+    assert len(set(indices.tolist())) == 100
+    assert indices.tolist() == sorted(indices.tolist())
+    assert numpy.count_nonzero(indices >= 900) > 10
+    assert get_spatial_indices(positions, 100, seed=0).tolist() == indices.tolist()
+    assert get_spatial_indices(positions, 2000, seed=0).tolist() == list(range(1000))
+    assert get_spatial_indices(numpy.zeros((5, 3)), 2, seed=0).shape == (2,)
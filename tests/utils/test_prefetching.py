@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from bcsb.utils.prefetching import Prefetcher
+
+
+class MockReader:
+    def __init__(self) -> None:
+        self.reads = list[int]()
+
+    def read(self, index: int) -> int:
+        self.reads.append(index)
+        return 10 * index
+
+
+def test_random_access() -> None:
+    reader = MockReader()
+    with ThreadPoolExecutor(1) as executor:
+        prefetcher = Prefetcher(reader.read, 2, executor, 100)
+        assert prefetcher.get(3) == 30
+        assert prefetcher.get(7) == 70
+        assert prefetcher.get(1) == 10
+        assert prefetcher.buffered == 0
+    assert reader.reads == [3, 7, 1]
+
+
+def test_sequential_access() -> None:
+    reader = MockReader()
+    with ThreadPoolExecutor(1) as executor:
+        prefetcher = Prefetcher(reader.read, 2, executor, 100)
+        assert [prefetcher.get(i) for i in range(5)] == [0, 10, 20, 30, 40]
+        assert prefetcher.buffered == 2
+    assert sorted(reader.reads) == [0, 1, 2, 3, 4, 5, 6]
+
+
+def test_strided_access() -> None:
+    reader = MockReader()
+    with ThreadPoolExecutor(1) as executor:
+        prefetcher = Prefetcher(reader.read, 3, executor, 100)
+        assert [prefetcher.get(i) for i in (8, 6, 4)] == [80, 60, 40]
+        assert prefetcher.buffered == 2
+    assert sorted(reader.reads) == [0, 2, 4, 6, 8]
+
+
+def test_stop() -> None:
+    reader = MockReader()
+    with ThreadPoolExecutor(1) as executor:
+        prefetcher = Prefetcher(reader.read, 3, executor, 5)
+        assert [prefetcher.get(i) for i in range(3)] == [0, 10, 20]
+        assert prefetcher.buffered == 2
+        assert prefetcher.get(4) == 40
+    assert max(reader.reads) == 4
+
+
+def test_clear() -> None:
+    reader = MockReader()
+    with ThreadPoolExecutor(1) as executor:
+        prefetcher = Prefetcher(reader.read, 2, executor, 100)
+        assert [prefetcher.get(i) for i in range(3)] == [0, 10, 20]
+        prefetcher.clear()
+        assert prefetcher.buffered == 0
+        assert prefetcher.get(3) == 30
+        assert prefetcher.buffered == 0
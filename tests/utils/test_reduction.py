@@ -0,0 +1,26 @@
+import numpy
+
+from bcsb.utils.reduction import Reduction, get_element_offsets, reduce_elements
+
+
+def test_get_element_offsets() -> None:
+    node_ids = numpy.array([7, 7, 3, 3, 3, 5, 100, 100])
+    assert get_element_offsets(node_ids).tolist() == [0, 2, 5, 6]
+    assert get_element_offsets(numpy.empty(0)).tolist() == []
+
+
+def test_reduce_elements() -> None:
+    values = numpy.array([[1, 3, 2, 8, 5, 4], [0, 1, 2, 3, 4, 5]], dtype=numpy.float32)
+    offsets = numpy.array([0, 2, 5])
+    assert reduce_elements(values, offsets, Reduction.NONE) is values
+    assert reduce_elements(values, offsets, Reduction.MEAN).tolist() == [[2, 5, 4], [0.5, 3, 5]]
+    assert reduce_elements(values, offsets, Reduction.MAX).tolist() == [[3, 8, 4], [1, 4, 5]]
+    assert reduce_elements(values, offsets, Reduction.MIN).tolist() == [[1, 2, 4], [0, 2, 5]]
+    assert reduce_elements(values, offsets, Reduction.SOMA).tolist() == [[1, 2, 4], [0, 2, 5]]
+    assert reduce_elements(values[0], offsets, Reduction.MEAN).dtype == numpy.float32
+
+
+def test_reduce_empty() -> None:
+    values = numpy.empty((3, 0), dtype=numpy.float32)
+    offsets = numpy.empty(0, dtype=numpy.int64)
+    assert reduce_elements(values, offsets, Reduction.MEAN).shape == (3, 0)
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import numpy
+
+from bcsb.utils.report_summary import PERCENTILES, SummaryCache, summarize_report
+
+
+def test_summarize_report() -> None:
+    data = numpy.arange(60, dtype=numpy.float32).reshape(10, 6)
+    reads = list[tuple[int, int]]()
+
+    def read(start: int, stop: int) -> numpy.ndarray:
+        reads.append((start, stop))
+        return data[start - 5 : stop - 5]
+
+    summary = summarize_report(read, 5, 15, 6, chunk_size=24)
+    assert reads == [(5, 9), (9, 13), (13, 15)]
+    assert summary.start == 5
+    assert summary.frame_count == 10
+    assert summary.min_value == 0
+    assert summary.max_value == 59
+    assert numpy.array_equal(summary.minimums, data.min(axis=1))
+    assert numpy.array_equal(summary.maximums, data.max(axis=1))
+    assert numpy.allclose(summary.means, data.mean(axis=1))
+    assert numpy.allclose(summary.percentiles, numpy.percentile(data, PERCENTILES))
+    packed = summary.pack()
+    assert packed.shape == (10, 3)
+    assert packed.dtype == numpy.float32
+
+
+def test_summarize_report_sampled() -> None:
+    data = numpy.arange(1000, dtype=numpy.float32).reshape(100, 10)
+    summary = summarize_report(lambda start, stop: data[start:stop], 0, 100, 10, chunk_size=70, max_samples=100)
+    assert numpy.allclose(summary.percentiles, numpy.percentile(data[:, 0], PERCENTILES))
+
+
+def test_summarize_empty_report() -> None:
+    summary = summarize_report(lambda start, stop: numpy.empty((0, 0)), 0, 0, 0)
+    assert summary.frame_count == 0
+    assert summary.min_value == 0
+    assert summary.max_value == 0
+
+
+def test_summary_cache(tmp_path: Path) -> None:
+    data = numpy.arange(12, dtype=numpy.float32).reshape(3, 4)
+    summary = summarize_report(lambda start, stop: data[start:stop], 0, 3, 4)
+    cache = SummaryCache(tmp_path, 2**20)
+    assert cache.load("key") is None
+    cache.save("key", summary)
+    loaded = cache.load("key")
+    assert loaded is not None
+    assert loaded.start == 0
+    assert numpy.array_equal(loaded.pack(), summary.pack())
+    assert numpy.array_equal(loaded.percentiles, summary.percentiles)
+    assert cache.load("other") is None
@@ -0,0 +1,77 @@
+import libsonata
+import numpy
+import pytest
+
+from bcsb.utils.selections import (
+    FLAT_SIZE_LIMIT,
+    SetOperation,
+    combine_selections,
+    difference,
+    get_ranges,
+    intersection,
+    merge_ranges,
+    union,
+)
+
+
+def test_merge_ranges() -> None:
+    ranges = numpy.array([[5, 8], [0, 2], [1, 3], [3, 4], [10, 10], [6, 7]], dtype=numpy.uint64)
+    assert merge_ranges(ranges).tolist() == [[0, 4], [5, 8]]
+    empty = numpy.empty((0, 2), dtype=numpy.uint64)
+    assert merge_ranges(empty).shape == (0, 2)
+
+
+@pytest.mark.parametrize("limit", [0, FLAT_SIZE_LIMIT])
+def test_union(monkeypatch: pytest.MonkeyPatch, limit: int) -> None:
+    monkeypatch.setattr("bcsb.utils.selections.FLAT_SIZE_LIMIT", limit)
+    selections = [
+        libsonata.Selection([(0, 3), (10, 12)]),
+        libsonata.Selection([(2, 5)]),
+        libsonata.Selection([]),
+    ]
+    assert union(selections).ranges == [(0, 5), (10, 12)]
+    assert union(selections[1:]).ranges == [(2, 5)]
+    assert union(selections[:1]).ranges == [(0, 3), (10, 12)]
+    assert union([]).flat_size == 0
+
+
+def test_get_ranges() -> None:
+    selection = libsonata.Selection([(0, 3), (10, 12)])
+    assert get_ranges(selection).tolist() == [[0, 3], [10, 12]]
+    assert get_ranges(libsonata.Selection([])).shape == (0, 2)
+
+
+def test_intersection() -> None:
+    selections = [
+        libsonata.Selection([(0, 10), (20, 30)]),
+        libsonata.Selection([(5, 25)]),
+        libsonata.Selection([(2, 8), (9, 22), (29, 40)]),
+    ]
+    assert intersection(selections).ranges == [(5, 8), (9, 10), (20, 22)]
+    assert intersection(selections[:1]).ranges == [(0, 10), (20, 30)]
+    assert intersection([selections[0], libsonata.Selection([])]).flat_size == 0
+    assert intersection([]).flat_size == 0
+
+
+def test_difference() -> None:
+    selection = libsonata.Selection([(0, 10), (20, 30)])
+    others = [libsonata.Selection([(5, 22)]), libsonata.Selection([(25, 26), (28, 40)])]
+    assert difference(selection, others).ranges == [(0, 5), (22, 25), (26, 28)]
+    assert difference(selection, []).ranges == [(0, 10), (20, 30)]
+    assert difference(libsonata.Selection([]), others).flat_size == 0
+
+
+@pytest.mark.parametrize("limit", [0, FLAT_SIZE_LIMIT])
+def test_combine_selections(monkeypatch: pytest.MonkeyPatch, limit: int) -> None:
+    monkeypatch.setattr("bcsb.utils.selections.FLAT_SIZE_LIMIT", limit)
+    rng = numpy.random.default_rng(0)
+    values = [rng.choice(1000, 300, replace=False) for _ in range(3)]
+    selections = [libsonata.Selection(numpy.sort(ids)) for ids in values]
+    expected = {
+        SetOperation.UNION: numpy.union1d(numpy.union1d(values[0], values[1]), values[2]),
+        SetOperation.INTERSECTION: numpy.intersect1d(numpy.intersect1d(values[0], values[1]), values[2]),
+        SetOperation.DIFFERENCE: numpy.setdiff1d(numpy.setdiff1d(values[0], values[1]), values[2]),
+    }
+    for operation, ids in expected.items():
+        assert combine_selections(operation, selections).flatten().tolist() == ids.tolist()
+    assert combine_selections(SetOperation.DIFFERENCE, []).flat_size == 0
@@ -0,0 +1,27 @@
+from bcsb.utils.shared_pool import SharedPool
+
+
+def test_acquire() -> None:
+    created = list[str]()
+
+    def factory() -> str:
+        created.append("value")
+        return "value"
+
+    pool = SharedPool[str, str]()
+    assert pool.acquire("key", factory) == "value"
+    assert pool.acquire("key", factory) == "value"
+    assert created == ["value"]
+    assert len(pool) == 1
+
+
+def test_release() -> None:
+    pool = SharedPool[str, int]()
+    pool.acquire("key", lambda: 1)
+    pool.acquire("key", lambda: 2)
+    pool.release("key")
+    assert "key" in pool
+    pool.release("key")
+    assert "key" not in pool
+    pool.release("key")
+    assert pool.acquire("key", lambda: 3) == 3
@@ -0,0 +1,52 @@
+import json
+import os
+from pathlib import Path
+
+from bcsb.utils.sonata_parser import SonataParser, parse_sonata_config
+
+
+def write_circuit(path: Path) -> Path:
+    circuit = path / "circuit_config.json"
+    circuit.write_text(json.dumps({"networks": {"nodes": [], "edges": []}}))
+    return circuit
+
+
+def write_simulation(path: Path) -> Path:
+    simulation = path / "simulation_config.json"
+    run = {"tstop": 1.0, "dt": 0.1, "random_seed": 0}
+    simulation.write_text(json.dumps({"network": "circuit_config.json", "run": run}))
+    return simulation
+
+
+def touch(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_parse(tmp_path: Path) -> None:
+    circuit = write_circuit(tmp_path)
+    simulation = write_simulation(tmp_path)
+    assert parse_sonata_config(circuit).simulation is None
+    assert parse_sonata_config(simulation).simulation is not None
+
+
+def test_cache(tmp_path: Path) -> None:
+    circuit = write_circuit(tmp_path)
+    simulation = write_simulation(tmp_path)
+    parser = SonataParser(2)
+    config = parser.parse(simulation)
+    assert config.simulation is not None
+    assert parser.parse(simulation) is config
+    assert parser.parse(tmp_path / ".." / tmp_path.name / simulation.name) is config
+    touch(circuit)
+    assert parser.parse(simulation) is not config
+
+
+def test_evict(tmp_path: Path) -> None:
+    circuit = write_circuit(tmp_path)
+    simulation = write_simulation(tmp_path)
+    parser = SonataParser(1)
+    config = parser.parse(circuit)
+    assert config.simulation is None
+    assert parser.parse(simulation).simulation is not None
+    assert parser.parse(circuit) is not config
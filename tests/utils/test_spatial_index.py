@@ -0,0 +1,45 @@
+import numpy
+
+from bcsb.utils.spatial_index import SpatialIndex
+
+
+def random_positions(count: int) -> numpy.ndarray:
+    generator = numpy.random.default_rng(0)
+    return generator.uniform(-100, 100, (count, 3)).astype(numpy.float32)
+
+
+def test_query_box() -> None:
+    positions = random_positions(5000)
+    index = SpatialIndex(positions)
+    lower = numpy.array([-20, -50, 0])
+    upper = numpy.array([30, 10, 80])
+    expected = numpy.flatnonzero(numpy.all((positions >= lower) & (positions <= upper), axis=1))
+    assert index.query_box(lower, upper).tolist() == expected.tolist()
+    assert len(index.query_box(numpy.full(3, 200), numpy.full(3, 300))) == 0
+    assert len(index.query_box(numpy.full(3, -200), numpy.full(3, 200))) == len(positions)
+
+
+def test_query_sphere() -> None:
+    positions = random_positions(5000)
+    index = SpatialIndex(positions)
+    center = numpy.array([10, -20, 5])
+    distances = numpy.linalg.norm(positions - center, axis=1)
+    expected = numpy.flatnonzero(distances <= 40)
+    assert index.query_sphere(center, 40).tolist() == expected.tolist()
+
+
+def test_query_planes() -> None:
+    positions = random_positions(5000)
+    index = SpatialIndex(positions)
+    planes = numpy.array([[1, 0, 0, 50], [-1, 1, 0, 10], [0, 0, -1, 30], [0.5, 0.5, 0.5, 20]])
+    expected = numpy.flatnonzero(numpy.all(positions @ planes[:, :3].T + planes[:, 3] >= 0, axis=1))
+    assert index.query_planes(planes).tolist() == expected.tolist()
+
+
+def test_degenerate() -> None:
+    empty = SpatialIndex(numpy.empty((0, 3), dtype=numpy.float32))
+    assert len(empty.query_sphere(numpy.zeros(3), 1)) == 0
+    flat = numpy.zeros((100, 3), dtype=numpy.float32)
+    flat[:, 0] = numpy.arange(100)
+    index = SpatialIndex(flat)
+    assert index.query_box(numpy.array([10, -1, -1]), numpy.array([19.5, 1, 1])).tolist() == list(range(10, 20))
@@ -0,0 +1,60 @@
+import math
+
+import numpy
+import pytest
+
+from bcsb.utils.spike_activity import SpikeActivity
+
+
+def test_read_frame() -> None:
+    node_ids = numpy.array([2, 5, 7], dtype=numpy.uint64)
+    spike_ids = numpy.array([5, 9, 2, 5], dtype=numpy.uint64)
+    times = numpy.array([1.0, 1.0, 0.5, 0.2])
+    activity = SpikeActivity(node_ids, spike_ids, times, 0.5, 1.0)
+    assert activity.node_count == 3
+    assert activity.spike_count == 3
+    assert activity.read_frame(0).tolist() == [0, 0, 0]
+    assert activity.read_frame(1).tolist() == [255, int(255 * math.exp(-0.3)), 0]
+    assert activity.read_frame(2).tolist() == [int(255 * math.exp(-0.5)), 255, 0]
+    assert activity.read_frame(100).tolist() == [0, 0, 0]
+
+
+def test_read_frames() -> None:
+    generator = numpy.random.default_rng(0)
+    node_ids = numpy.arange(10, 60, dtype=numpy.uint64)
+    spike_ids = generator.integers(0, 100, 1000).astype(numpy.uint64)
+    times = generator.uniform(0, 100, 1000)
+    activity = SpikeActivity(node_ids, spike_ids, times, 0.1, 2.0)
+    frames = activity.read_frames(100, 200, 3)
+    assert frames.shape == (34, 50)
+    assert frames.dtype == numpy.uint8
+    for index, frame in enumerate(range(100, 200, 3)):
+        assert numpy.array_equal(frames[index], activity.read_frame(frame))
+
+
+def test_invalid_parameters() -> None:
+    ids = numpy.empty(0, dtype=numpy.uint64)
+    times = numpy.empty(0)
+    with pytest.raises(ValueError):
+        SpikeActivity(ids, ids, times, 0.0, 1.0)
+    with pytest.raises(ValueError):
+        SpikeActivity(ids, ids, times, 0.1, 0.0)
+    activity = SpikeActivity(ids, ids, times, 0.1, 1.0)
+    assert activity.read_frames(0, 2).shape == (2, 0)
+
+
+def test_read_frames_chunks() -> None:
+    generator = numpy.random.default_rng(1)
+    node_ids = numpy.arange(100, dtype=numpy.uint64)
+    spike_ids = generator.integers(0, 100, 5000).astype(numpy.uint64)
+    times = numpy.sort(generator.uniform(0, 50, 5000))
+    activity = SpikeActivity(node_ids, spike_ids, times, 0.1, 1.0)
+    frames = activity.read_frames(0, 500, 2)
+    assert numpy.array_equal(frames, activity.read_frames(0, 500, 2, chunk_size=7))
+    for index, frame in enumerate(range(0, 500, 2)):
+        time = frame * 0.1
+        spiked = (times <= time) & (times > time - 1.0 * math.log(256))
+        last = numpy.full(100, -numpy.inf)
+        numpy.maximum.at(last, spike_ids[spiked].astype(numpy.int64), times[spiked])
+        expected = (numpy.exp(((last - time) / 1.0).astype(numpy.float32)) * 255).astype(numpy.uint8)
+        assert numpy.array_equal(frames[index], expected)